@@ -18,6 +18,7 @@ from tradingagents.default_config import DEFAULT_CONFIG
 from dotenv import load_dotenv
 
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.dataflows.vendor_health import get_vendor_health
 from scheduler_service import AnalysisScheduler
 
 # Load environment variables
@@ -465,6 +466,17 @@ with st.sidebar:
                 msg = temp_mem.load_from_obsidian(obsidian_path)
                 st.success(msg)
 
+    st.divider()
+    with st.expander("🩺 Data Vendor Health"):
+        health_rows = get_vendor_health().snapshot()
+        if health_rows:
+            st.dataframe(health_rows, use_container_width=True, hide_index=True)
+            if st.button("Reset Vendor Health"):
+                get_vendor_health().reset()
+                st.rerun()
+        else:
+            st.caption("No vendor calls recorded yet.")
+
 # --- Tab Layout ---
 tab1, tab2 = st.tabs(["🚀 Manual Analysis", "⏰ Scheduled Results"])
 
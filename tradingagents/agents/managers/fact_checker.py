@@ -1,51 +1,69 @@
 from langchain_core.messages import AIMessage
 import json
 import re
+import asyncio
 import requests
 import warnings
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 from concurrent.futures import ThreadPoolExecutor
 
+from tradingagents.dataflows.async_http import get_async_client
+
 # Suppress only the single warning from urllib3 needed.
 warnings.simplefilter('ignore', InsecureRequestWarning)
 
+# mimicking the headers we found effective
+URL_CHECK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+# Limit concurrent URL checks to avoid being flagged as DoS
+MAX_URL_CHECKS = 5
+
+def _url_status(status_code):
+    # Treat 403 as potentially accessible but blocked by WAF
+    if 200 <= status_code < 400:
+        return "VALID"
+    elif status_code == 404:
+        return "NOT FOUND (404)"
+    elif status_code == 403:
+        return "VALID (Protected/403)"
+    else:
+        return f"ACCESSIBLE (Status: {status_code})"
+
 def verify_url(url):
     try:
         # Use requests library instead of curl for better portability across OS
-        # mimicking the headers we found effective
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': 'https://www.google.com/',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'cross-site',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0'
-        }
-
         # Use GET with stream=True to check headers/status without downloading full body
         # verify=False is equivalent to curl -k (insecure)
-        response = requests.get(url, headers=headers, timeout=15, stream=True, verify=False)
-        
-        status_code = response.status_code
-
-        # Treat 403 as potentially accessible but blocked by WAF
-        if 200 <= status_code < 400:
-            return url, "VALID"
-        elif status_code == 404:
-            return url, "NOT FOUND (404)"
-        elif status_code == 403:
-             return url, "VALID (Protected/403)" 
-        else:
-            return url, f"ACCESSIBLE (Status: {status_code})"
+        response = requests.get(url, headers=URL_CHECK_HEADERS, timeout=15, stream=True, verify=False)
+        return url, _url_status(response.status_code)
 
     except Exception as e:
         # Fallback error handling
         return url, f"ERROR (Could not access: {str(e)})"
 
+async def averify_url(url):
+    """Async counterpart of verify_url, on the shared (unverified TLS) async HTTP client."""
+    try:
+        # Streaming reads the status line and headers only
+        async with get_async_client(verify=False).stream(
+            "GET", url, headers=URL_CHECK_HEADERS, timeout=15
+        ) as response:
+            return url, _url_status(response.status_code)
+
+    except Exception as e:
+        return url, f"ERROR (Could not access: {str(e)})"
+
 def get_unique_urls(text):
     if not text:
         return []
@@ -67,8 +85,7 @@ def check_urls_and_get_data(text, source_label):
         return []
         
     results = []
-    # Limit max workers to avoid being flagged as DoS
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with ThreadPoolExecutor(max_workers=MAX_URL_CHECKS) as executor:
         futures = [executor.submit(verify_url, url) for url in unique_urls]
         for future in futures:
             url, status = future.result()
@@ -79,6 +96,25 @@ def check_urls_and_get_data(text, source_label):
             })
     return results
 
+async def acheck_urls_and_get_data(text, source_label):
+    """Async counterpart of check_urls_and_get_data."""
+    unique_urls = get_unique_urls(text)
+
+    if not unique_urls:
+        return []
+
+    slots = asyncio.Semaphore(MAX_URL_CHECKS)
+
+    async def check(url):
+        async with slots:
+            return await averify_url(url)
+
+    checked = await asyncio.gather(*(check(url) for url in unique_urls))
+    return [
+        {"url": url, "status": status, "source": source_label}
+        for url, status in checked
+    ]
+
 def create_fact_checker(llm):
     def fact_checker_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
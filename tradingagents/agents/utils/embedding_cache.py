@@ -0,0 +1,141 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embeddings shared across runs and processes.
+
+    Rows are keyed on (model, SHA-256 of the text) and hold the vector as
+    raw float32 bytes. Each hit refreshes the row's last-use time, and once
+    the store grows past max_entries the least recently used rows are evicted.
+    """
+
+    def __init__(self, db_path: str, max_entries: int):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, digest)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        digest = self.digest(text)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector FROM embeddings WHERE model = ? AND digest = ?", (model, digest)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE embeddings SET last_used = ? WHERE model = ? AND digest = ?",
+                (time.time(), model, digest),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """Cached embeddings for texts, None where missing, in one transaction."""
+        digests = [self.digest(text) for text in texts]
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(digests), 500):
+                chunk = digests[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT digest, vector FROM embeddings WHERE model = ? AND digest IN ({placeholders})",
+                    (model, *chunk),
+                ))
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE model = ? AND digest = ?",
+                [(now, model, digest) for digest in found],
+            )
+            self._conn.commit()
+            self.hits += sum(digest in found for digest in digests)
+            self.misses += sum(digest not in found for digest in digests)
+        return [
+            np.frombuffer(found[digest], dtype=np.float32).tolist() if digest in found else None
+            for digest in digests
+        ]
+
+    def put(self, model: str, text: str, embedding: List[float]) -> None:
+        self.put_many(model, [text], [embedding])
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]) -> None:
+        now = time.time()
+        rows = [
+            (model, self.digest(text), now, np.asarray(embedding, dtype=np.float32).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        excess = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                """
+                DELETE FROM embeddings WHERE (model, digest) IN (
+                    SELECT model, digest FROM embeddings ORDER BY last_used LIMIT ?
+                )
+                """,
+                (excess,),
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+
+_caches = {}
+_caches_guard = threading.Lock()
+
+
+def get_embedding_cache(config: dict) -> Optional[EmbeddingCache]:
+    """Return the cache for config's data_cache_dir, or None when embedding caching is disabled."""
+    if not config.get("embedding_cache_enabled", True):
+        return None
+
+    db_path = os.path.join(config["data_cache_dir"], "embedding_cache.sqlite")
+    with _caches_guard:
+        if db_path not in _caches:
+            _caches[db_path] = EmbeddingCache(db_path, config.get("embedding_cache_max_entries", 50_000))
+        return _caches[db_path]
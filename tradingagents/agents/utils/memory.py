@@ -1,8 +1,64 @@
 import os
+import threading
 import chromadb
+from concurrent.futures import ThreadPoolExecutor
 from chromadb.config import Settings
 from openai import OpenAI
 
+from tradingagents.agents.utils.embedding_cache import get_embedding_cache
+from tradingagents.agents.utils.obsidian_sync import ObsidianSync
+
+
+class MemoryRegistry:
+    """Process-wide owner of the clients behind every FinancialSituationMemory.
+
+    One Chroma client per database path, one embeddings client per backend
+    URL, and one handle per collection, created on first use. Graph
+    instances running concurrently (e.g. scheduled jobs) share them all.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chroma_clients = {}
+        self._embedding_clients = {}
+        self._collections = {}
+        self._write_locks = {}
+
+    def get_chroma_client(self, db_path):
+        with self._lock:
+            if db_path not in self._chroma_clients:
+                # Use PersistentClient to save data to disk
+                self._chroma_clients[db_path] = chromadb.PersistentClient(
+                    path=db_path, settings=Settings(allow_reset=True)
+                )
+            return self._chroma_clients[db_path]
+
+    def get_embedding_client(self, backend_url):
+        with self._lock:
+            if backend_url not in self._embedding_clients:
+                self._embedding_clients[backend_url] = OpenAI(base_url=backend_url)
+            return self._embedding_clients[backend_url]
+
+    def get_collection(self, db_path, name):
+        chroma_client = self.get_chroma_client(db_path)
+        with self._lock:
+            if (db_path, name) not in self._collections:
+                self._collections[(db_path, name)] = chroma_client.get_or_create_collection(name=name)
+            return self._collections[(db_path, name)]
+
+    def write_lock(self, db_path, name):
+        """Lock serializing adds to one collection, whose ids are assigned from its count."""
+        with self._lock:
+            return self._write_locks.setdefault((db_path, name), threading.Lock())
+
+
+_registry = MemoryRegistry()
+
+
+def get_memory_registry() -> MemoryRegistry:
+    """Return the process-wide memory registry."""
+    return _registry
+
 
 class FinancialSituationMemory:
     def __init__(self, name, config):
@@ -10,46 +66,139 @@ class FinancialSituationMemory:
             self.embedding = "nomic-embed-text"
         else:
             self.embedding = "text-embedding-3-small"
-        self.client = OpenAI(base_url=config["backend_url"])
-        # Use PersistentClient to save data to disk
-        db_path = os.path.join(config.get("project_dir", "."), "chroma_db")
-        self.chroma_client = chromadb.PersistentClient(path=db_path, settings=Settings(allow_reset=True))
-        self.situation_collection = self.chroma_client.get_or_create_collection(name=name)
+        self.name = name
+        self.db_path = os.path.join(config.get("project_dir", "."), "chroma_db")
+        self.client = get_memory_registry().get_embedding_client(config["backend_url"])
+        self.embedding_cache = get_embedding_cache(config)
+        self.batch_size = config.get("embedding_batch_size", 256)
+        self.batch_max_tokens = config.get("embedding_batch_max_tokens", 250_000)
+        self.max_concurrent_batches = config.get("embedding_max_concurrency", 4)
+        self.add_batch_size = config.get("memory_add_batch_size", 1000)
+        self.run_context = None
+
+    @property
+    def chroma_client(self):
+        return get_memory_registry().get_chroma_client(self.db_path)
+
+    @property
+    def situation_collection(self):
+        # Opened on first use, so memories a run never touches cost nothing
+        return get_memory_registry().get_collection(self.db_path, self.name)
 
     def get_embedding(self, text):
-        """Get OpenAI embedding for a text"""
-        
-        response = self.client.embeddings.create(
-            model=self.embedding, input=text
-        )
-        return response.data[0].embedding
+        """Get OpenAI embedding for a text, reusing the cached one for text embedded before"""
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts):
+        """Get OpenAI embeddings for many texts, in input order.
+
+        Cached embeddings are reused; the rest are requested in batches of at
+        most embedding_batch_size texts and embedding_batch_max_tokens
+        (estimated) tokens, with up to embedding_max_concurrency batches in flight.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get_many(self.embedding, unique_texts)
+        else:
+            cached = [None] * len(unique_texts)
+        embeddings = {text: emb for text, emb in zip(unique_texts, cached) if emb is not None}
+        missing = [text for text in unique_texts if text not in embeddings]
+
+        batches = self._split_batches(missing)
+        if batches:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent_batches, len(batches)))) as executor:
+                for batch, batch_embeddings in zip(batches, executor.map(self._embed_batch, batches)):
+                    embeddings.update(zip(batch, batch_embeddings))
+                    if self.embedding_cache is not None:
+                        self.embedding_cache.put_many(self.embedding, batch, batch_embeddings)
+
+        return [embeddings[text] for text in texts]
+
+    def _split_batches(self, texts):
+        batches = []
+        batch, batch_tokens = [], 0
+        for text in texts:
+            # Rough estimate; the API limit is on tokens per request
+            tokens = len(text) // 4 + 1
+            if batch and (len(batch) >= self.batch_size or batch_tokens + tokens > self.batch_max_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _embed_batch(self, batch):
+        response = self.client.embeddings.create(model=self.embedding, input=batch)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
 
-        situations = []
-        advice = []
-        ids = []
-        embeddings = []
+        situations = [situation for situation, _ in situations_and_advice]
+        advice = [recommendation for _, recommendation in situations_and_advice]
+        embeddings = self.get_embeddings(situations)
+
+        collection = self.situation_collection
+        with get_memory_registry().write_lock(self.db_path, self.name):
+            offset = collection.count()
+            ids = [str(offset + i) for i in range(len(situations))]
+            # Deleted entries (e.g. removed Obsidian notes) make count() lag behind the ids in use
+            taken = collection.get(ids=ids, include=[])["ids"] if ids else []
+            while taken:
+                offset = max(int(note_id) for note_id in taken) + 1
+                ids = [str(offset + i) for i in range(len(situations))]
+                taken = collection.get(ids=ids, include=[])["ids"]
 
-        offset = self.situation_collection.count()
+            # Chroma caps how many records one add may carry
+            chunk = min(self.add_batch_size, self.chroma_client.get_max_batch_size())
+            for start in range(0, len(situations), chunk):
+                end = start + chunk
+                collection.add(
+                    documents=situations[start:end],
+                    metadatas=[{"recommendation": rec} for rec in advice[start:end]],
+                    embeddings=embeddings[start:end],
+                    ids=ids[start:end],
+                )
 
-        for i, (situation, recommendation) in enumerate(situations_and_advice):
-            situations.append(situation)
-            advice.append(recommendation)
-            ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+    def upsert_situations(self, ids, situations_and_advice):
+        """Add or replace situations under caller-chosen ids. Parameter is a list of tuples (situation, rec)"""
+        situations = [situation for situation, _ in situations_and_advice]
+        advice = [recommendation for _, recommendation in situations_and_advice]
+        embeddings = self.get_embeddings(situations)
 
-        self.situation_collection.add(
-            documents=situations,
-            metadatas=[{"recommendation": rec} for rec in advice],
-            embeddings=embeddings,
-            ids=ids,
-        )
+        collection = self.situation_collection
+        chunk = min(self.add_batch_size, self.chroma_client.get_max_batch_size())
+        with get_memory_registry().write_lock(self.db_path, self.name):
+            for start in range(0, len(situations), chunk):
+                end = start + chunk
+                collection.upsert(
+                    documents=situations[start:end],
+                    metadatas=[{"recommendation": rec} for rec in advice[start:end]],
+                    embeddings=embeddings[start:end],
+                    ids=ids[start:end],
+                )
+
+    def delete_situations(self, ids):
+        """Remove situations by id"""
+        collection = self.situation_collection
+        chunk = self.chroma_client.get_max_batch_size()
+        with get_memory_registry().write_lock(self.db_path, self.name):
+            for start in range(0, len(ids), chunk):
+                collection.delete(ids=ids[start:start + chunk])
+
+    def get_memories(self, current_situation, n_matches=1, query_embedding=None):
+        """Find matching recommendations using OpenAI embeddings
 
-    def get_memories(self, current_situation, n_matches=1):
-        """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+        Inside a run with a SituationMemoryContext attached, the situation is
+        embedded and matched once for every memory of the run; pass
+        query_embedding to match an embedding computed elsewhere.
+        """
+        if query_embedding is None:
+            if self.run_context is not None and self.run_context.covers(self):
+                return self.run_context.get_memories(self, current_situation, n_matches)
+            query_embedding = self.get_embedding(current_situation)
 
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
@@ -71,45 +220,17 @@ class FinancialSituationMemory:
         return matched_results
 
     def load_from_obsidian(self, vault_path):
-        """Load markdown files from an Obsidian vault into memory"""
-        import os
-        import glob
-        
+        """Sync markdown files from an Obsidian vault into memory, embedding only new or changed notes"""
         if not os.path.exists(vault_path):
             return f"Error: Obsidian path not found: {vault_path}"
 
-        md_files = glob.glob(os.path.join(vault_path, "**/*.md"), recursive=True)
-        new_data = []
-        count = 0
-        
-        for file_path in md_files:
-            try:
-                # Skip system files or hidden files
-                if "/." in file_path or "\\." in file_path:
-                    continue
-                    
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if not content.strip():
-                        continue
-                        
-                    filename = os.path.basename(file_path)
-                    
-                    # Strategy: Use Filename + Start of content as 'Situation' context
-                    # Use full content as 'Recommendation/Knowledge'
-                    # This allows retrieving the note when context matches the title/intro
-                    situation_context = f"Note Title: {filename}\nContext: {content[:300]}"
-                    
-                    new_data.append((situation_context, content))
-                    count += 1
-            except Exception as e:
-                print(f"Failed to read {file_path}: {e}")
-        
-        if new_data:
-            self.add_situations(new_data)
-            return f"Successfully loaded {count} notes from Obsidian vault."
-        else:
+        counts = ObsidianSync(self, vault_path).sync()
+        if not any(counts.values()):
             return "No markdown files found in the specified path."
+        return (
+            f"Synced Obsidian vault: {counts['added']} added, {counts['updated']} updated, "
+            f"{counts['removed']} removed, {counts['unchanged']} unchanged."
+        )
 
     def save_to_obsidian(self, content, filename, vault_path, folder="TradingAgents/Reports"):
         """Save a report to the Obsidian vault"""
@@ -131,6 +252,55 @@ class FinancialSituationMemory:
             return False, f"Failed to save: {str(e)}"
 
 
+def query_memories(memories, situation, n_matches=1):
+    """Match one situation against several memories, embedding it only once.
+
+    Returns {memory name: matched results}, as get_memories would for each.
+    """
+    if not memories:
+        return {}
+    query_embedding = memories[0].get_embedding(situation)
+    return {
+        memory.name: memory.get_memories(situation, n_matches, query_embedding=query_embedding)
+        for memory in memories
+    }
+
+
+class SituationMemoryContext:
+    """Per-run memory retrieval shared by the agents of one propagate().
+
+    The researchers, trader and managers all look up the same situation (the
+    analyst reports), the researchers once per debate round. The first lookup
+    embeds it and queries every memory of the run in one batch; the rest
+    are served from that result until the situation changes.
+    """
+
+    def __init__(self, memories):
+        self.memories = list(memories)
+        self._names = {memory.name for memory in self.memories}
+        self._lock = threading.Lock()
+        self._situation = None
+        # n_matches -> {memory name: matched results}
+        self._results = {}
+
+    def attach(self):
+        for memory in self.memories:
+            memory.run_context = self
+        return self
+
+    def covers(self, memory):
+        return memory.name in self._names
+
+    def get_memories(self, memory, situation, n_matches=1):
+        with self._lock:
+            if situation != self._situation:
+                self._situation = situation
+                self._results = {}
+            if n_matches not in self._results:
+                self._results[n_matches] = query_memories(self.memories, situation, n_matches)
+            return list(self._results[n_matches][memory.name])
+
+
 if __name__ == "__main__":
     # Example usage
     matcher = FinancialSituationMemory()
@@ -0,0 +1,169 @@
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+# Notes are read in parallel; reads are I/O bound
+READ_WORKERS = 8
+
+
+def note_situation(filename: str, content: str) -> Tuple[str, str]:
+    """(situation, recommendation) stored for a note.
+
+    Strategy: Use Filename + Start of content as 'Situation' context
+    Use full content as 'Recommendation/Knowledge'
+    This allows retrieving the note when context matches the title/intro
+    """
+    return f"Note Title: {filename}\nContext: {content[:300]}", content
+
+
+def list_notes(vault_path: str) -> Dict[str, Tuple[float, int]]:
+    """Vault-relative path -> (mtime, size) of every markdown note, skipping hidden files and folders."""
+    notes = {}
+    for root, dirs, files in os.walk(vault_path):
+        # Skip system files or hidden files
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for filename in files:
+            if filename.startswith(".") or not filename.endswith(".md"):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            notes[os.path.relpath(path, vault_path)] = (stat.st_mtime, stat.st_size)
+    return notes
+
+
+def _note_id(rel_path: str) -> str:
+    return "obsidian:" + hashlib.sha1(rel_path.encode("utf-8")).hexdigest()
+
+
+class ObsidianSync:
+    """Incremental sync of an Obsidian vault into one memory collection.
+
+    A manifest next to the Chroma database maps each note's vault-relative
+    path to (mtime, size, content hash, collection id). A sync only reads
+    notes whose mtime or size changed, re-embeds those whose content changed,
+    and deletes the entries of notes that were removed or emptied. Each note
+    keeps a stable id derived from its path, so reloads update in place
+    instead of adding duplicates. The first sync of a vault also drops the
+    integer-id copies its notes got from earlier full reloads.
+    """
+
+    def __init__(self, memory, vault_path: str):
+        self.memory = memory
+        self.vault_path = os.path.abspath(vault_path)
+        vault_key = hashlib.sha1(self.vault_path.encode("utf-8")).hexdigest()[:16]
+        self.manifest_path = os.path.join(
+            memory.db_path, f"obsidian_manifest_{memory.name}_{vault_key}.json"
+        )
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)["notes"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _save_manifest(self, notes: Dict[str, dict]) -> None:
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"vault": self.vault_path, "notes": notes}, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _legacy_ids(self, current: Dict[str, Tuple[float, int]]) -> List[str]:
+        """Ids of note entries loaded before syncs were incremental, for notes of this vault.
+
+        Those loads added every note under a sequential integer id on each
+        call, so the first sync replaces them with its path-keyed entries.
+        """
+        titles = {f"Note Title: {os.path.basename(rel_path)}\n" for rel_path in current}
+        if not titles:
+            return []
+        entries = self.memory.situation_collection.get(
+            where_document={"$contains": "Note Title: "}, include=["documents"]
+        )
+        return [
+            entry_id for entry_id, document in zip(entries["ids"], entries["documents"])
+            if not entry_id.startswith("obsidian:")
+            and document.split("\n", 1)[0] + "\n" in titles
+        ]
+
+    def _read(self, rel_path: str):
+        try:
+            with open(os.path.join(self.vault_path, rel_path), "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            print(f"Failed to read {os.path.join(self.vault_path, rel_path)}: {e}")
+            return None
+
+    def sync(self) -> Dict[str, int]:
+        """Bring the collection in line with the vault. Returns counts per kind of change."""
+        first_sync = not os.path.exists(self.manifest_path)
+        manifest = self._load_manifest()
+        current = list_notes(self.vault_path)
+
+        to_read = [
+            rel_path for rel_path, (mtime, size) in current.items()
+            if rel_path not in manifest
+            or manifest[rel_path]["mtime"] != mtime
+            or manifest[rel_path]["size"] != size
+        ]
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            contents = dict(zip(to_read, executor.map(self._read, to_read)))
+
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": len(current) - len(to_read)}
+        upserts: List[Tuple[str, Tuple[str, str]]] = []
+        removed_ids = []
+        new_manifest = {
+            rel_path: entry for rel_path, entry in manifest.items()
+            if rel_path in current and rel_path not in contents
+        }
+
+        for rel_path, content in contents.items():
+            previous = manifest.get(rel_path)
+            if content is None:
+                # Unreadable this time; keep whatever was stored
+                if previous is not None:
+                    new_manifest[rel_path] = previous
+                continue
+            if not content.strip():
+                if previous is not None:
+                    removed_ids.append(previous["id"])
+                    counts["removed"] += 1
+                continue
+
+            mtime, size = current[rel_path]
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+            entry = {"mtime": mtime, "size": size, "sha256": digest, "id": _note_id(rel_path)}
+            new_manifest[rel_path] = entry
+            if previous is not None and previous["sha256"] == digest:
+                # Touched but not edited
+                counts["unchanged"] += 1
+                continue
+            upserts.append((entry["id"], note_situation(os.path.basename(rel_path), content)))
+            counts["updated" if previous is not None else "added"] += 1
+
+        for rel_path, entry in manifest.items():
+            if rel_path not in current:
+                removed_ids.append(entry["id"])
+                counts["removed"] += 1
+
+        if first_sync:
+            legacy_ids = self._legacy_ids(current)
+            removed_ids.extend(legacy_ids)
+            counts["removed"] += len(legacy_ids)
+
+        if upserts:
+            self.memory.upsert_situations(
+                [note_id for note_id, _ in upserts], [pair for _, pair in upserts]
+            )
+        if removed_ids:
+            self.memory.delete_situations(removed_ids)
+        if first_sync or upserts or removed_ids or new_manifest != manifest:
+            self._save_manifest(new_manifest)
+        return counts
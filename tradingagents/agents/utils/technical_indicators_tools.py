@@ -5,7 +5,7 @@ from tradingagents.dataflows.interface import route_to_vendor
 @tool
 def get_indicators(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    indicator: Annotated[str, "technical indicator to get the analysis and report of; pass several comma-separated names (e.g. 'rsi,macd,boll') to get them in one table"],
     curr_date: Annotated[str, "The current trading date you are trading on, YYYY-mm-dd"],
     look_back_days: Annotated[int, "how many days to look back"] = 30,
 ) -> str:
@@ -14,10 +14,11 @@ def get_indicators(
     Uses the configured technical_indicators vendor.
     Args:
         symbol (str): Ticker symbol of the company, e.g. AAPL, TSM
-        indicator (str): Technical indicator to get the analysis and report of
+        indicator (str): Technical indicator to get the analysis and report of.
+            Several comma-separated indicators are computed together and returned as one table.
         curr_date (str): The current trading date you are trading on, YYYY-mm-dd
         look_back_days (int): How many days to look back, default is 30
     Returns:
-        str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator.
+        str: A formatted dataframe containing the technical indicators for the specified ticker symbol and indicator(s).
     """
     return route_to_vendor("get_indicators", symbol, indicator, curr_date, look_back_days)
\ No newline at end of file
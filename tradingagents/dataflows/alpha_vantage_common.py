@@ -1,9 +1,16 @@
 import os
+import time
+import asyncio
+import threading
 import requests
 import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .async_http import get_async_client
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -39,20 +46,165 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
-def _make_api_request(function_name: str, params: dict) -> dict | str:
-    """Helper function to make API requests and handle responses.
-    
-    Raises:
-        AlphaVantageRateLimitError: When API rate limit is exceeded
+class _TokenBucket:
+    """Token bucket refilled continuously at `calls` per `period` seconds.
+
+    Callers reserve a token even when none is left; the bucket goes negative
+    and the returned delay tells them how long to wait for their turn, so
+    concurrent callers are served in the order they arrived.
+    """
+
+    def __init__(self, calls: int, period: float):
+        self.capacity = float(calls)
+        self.refill_rate = calls / period
+        self.tokens = float(calls)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def delay(self, now: float) -> float:
+        """Seconds the next call would have to wait."""
+        self._refill(now)
+        return max(0.0, (1.0 - self.tokens) / self.refill_rate)
+
+    def take(self) -> None:
+        self.tokens -= 1.0
+
+
+class AlphaVantageClient:
+    """Alpha Vantage client for one API key, shared by every thread in the process.
+
+    Requests go through a pooled keep-alive session with a timeout. Calls are
+    throttled client-side with per-minute and per-day token buckets: a call
+    that would exceed the per-minute budget waits for its slot instead of
+    being rejected by the API, while a call that would have to wait longer
+    than alpha_vantage_max_wait (e.g. the daily budget is spent) fails fast
+    with AlphaVantageRateLimitError so route_to_vendor can fall back.
     """
+
+    def __init__(self, api_key: str, calls_per_minute: int = None, calls_per_day: int = None,
+                 timeout: float = 30, max_wait: float = 120):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_wait = max_wait
+        self._buckets = []
+        if calls_per_minute:
+            self._buckets.append(_TokenBucket(calls_per_minute, 60))
+        if calls_per_day:
+            self._buckets.append(_TokenBucket(calls_per_day, 24 * 60 * 60))
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _reserve(self) -> float:
+        """Reserve a call slot and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max((bucket.delay(now) for bucket in self._buckets), default=0.0)
+            if wait > self.max_wait:
+                raise AlphaVantageRateLimitError(
+                    f"Alpha Vantage client-side rate limit reached (next slot in {wait:.0f}s)"
+                )
+            for bucket in self._buckets:
+                bucket.take()
+
+        if wait > 0:
+            print(f"DEBUG: Alpha Vantage throttled, waiting {wait:.1f}s for a request slot")
+        return wait
+
+    def _acquire(self) -> None:
+        """Reserve a call slot, sleeping until it comes up."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def _exhaust(self) -> None:
+        """The API reported a rate limit we did not anticipate; stop sending calls for a while."""
+        with self._lock:
+            now = time.monotonic()
+            for bucket in self._buckets:
+                bucket._refill(now)
+                bucket.tokens = min(bucket.tokens, 0.0)
+
+    def _query_params(self, function_name: str, params: dict) -> dict:
+        api_params = params.copy()
+        api_params.update({
+            "function": function_name,
+            "apikey": self.api_key,
+            "source": "trading_agents",
+        })
+        return api_params
+
+    def request(self, function_name: str, params: dict) -> str:
+        """Make one API call and return the response body.
+
+        Raises:
+            AlphaVantageRateLimitError: When the call is over budget or the API reports a rate limit
+        """
+        self._acquire()
+        response = self.session.get(
+            API_BASE_URL, params=self._query_params(function_name, params), timeout=self.timeout
+        )
+        response.raise_for_status()
+        return self._check_response(response.text)
+
+    async def arequest(self, function_name: str, params: dict) -> str:
+        """Async counterpart of request, on the shared async HTTP client. Shares the rate limits."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        response = await get_async_client().get(
+            API_BASE_URL, params=self._query_params(function_name, params), timeout=self.timeout
+        )
+        response.raise_for_status()
+        return self._check_response(response.text)
+
+    def _check_response(self, response_text: str) -> str:
+        # Check if response is JSON (error responses are typically JSON)
+        try:
+            response_json = json.loads(response_text)
+            # Check for rate limit error
+            if "Information" in response_json:
+                info_message = response_json["Information"]
+                if "rate limit" in info_message.lower() or "api key" in info_message.lower():
+                    self._exhaust()
+                    raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
+        except json.JSONDecodeError:
+            # Response is not JSON (likely CSV data), which is normal
+            pass
+
+        return response_text
+
+
+_clients = {}
+_clients_guard = threading.Lock()
+
+
+def get_client() -> AlphaVantageClient:
+    """Return the shared client for the configured API key, creating it on first use."""
+    api_key = get_api_key()
+    with _clients_guard:
+        if api_key not in _clients:
+            config = get_config()
+            _clients[api_key] = AlphaVantageClient(
+                api_key,
+                calls_per_minute=config.get("alpha_vantage_calls_per_minute"),
+                calls_per_day=config.get("alpha_vantage_calls_per_day"),
+                timeout=config.get("alpha_vantage_timeout", 30),
+                max_wait=config.get("alpha_vantage_max_wait", 120),
+            )
+        return _clients[api_key]
+
+
+def _request_params(params: dict) -> dict:
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
-    api_params.update({
-        "function": function_name,
-        "apikey": get_api_key(),
-        "source": "trading_agents",
-    })
-    
+
     # Handle entitlement parameter if present in params or global variable
     current_entitlement = globals().get('_current_entitlement')
     entitlement = api_params.get("entitlement") or current_entitlement
@@ -62,25 +214,26 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
 
-    response_text = response.text
+    return api_params
+
+
+def _make_api_request(function_name: str, params: dict) -> dict | str:
+    """Helper function to make API requests and handle responses.
     
-    # Check if response is JSON (error responses are typically JSON)
-    try:
-        response_json = json.loads(response_text)
-        # Check for rate limit error
-        if "Information" in response_json:
-            info_message = response_json["Information"]
-            if "rate limit" in info_message.lower() or "api key" in info_message.lower():
-                raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
-    except json.JSONDecodeError:
-        # Response is not JSON (likely CSV data), which is normal
-        pass
-
-    return response_text
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    return get_client().request(function_name, _request_params(params))
+
+
+async def _amake_api_request(function_name: str, params: dict) -> dict | str:
+    """Async counterpart of _make_api_request.
+
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    return await get_client().arequest(function_name, _request_params(params))
 
 
 
@@ -1,8 +1,92 @@
-from .alpha_vantage_common import _make_api_request
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from io import StringIO
+
+import pandas as pd
+
+from .alpha_vantage_common import _make_api_request, AlphaVantageRateLimitError
+from .utils import parse_indicator_list
+
+# Parsed API responses, keyed on (function, params, day); one entry per distinct call
+_MAX_CACHED_RESPONSES = 64
+_responses: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+_inflight = {}
+_responses_lock = threading.Lock()
+
+
+def _indicator_request(indicator: str, symbol: str, interval: str, time_period: int, series_type: str):
+    """Alpha Vantage function and parameters that serve an indicator."""
+    if indicator == "close_50_sma":
+        return "SMA", {"symbol": symbol, "interval": interval, "time_period": "50", "series_type": series_type}
+    if indicator == "close_200_sma":
+        return "SMA", {"symbol": symbol, "interval": interval, "time_period": "200", "series_type": series_type}
+    if indicator == "close_10_ema":
+        return "EMA", {"symbol": symbol, "interval": interval, "time_period": "10", "series_type": series_type}
+    if indicator in ("macd", "macds", "macdh"):
+        return "MACD", {"symbol": symbol, "interval": interval, "series_type": series_type}
+    if indicator == "rsi":
+        return "RSI", {"symbol": symbol, "interval": interval, "time_period": str(time_period), "series_type": series_type}
+    if indicator in ("boll", "boll_ub", "boll_lb"):
+        return "BBANDS", {"symbol": symbol, "interval": interval, "time_period": "20", "series_type": series_type}
+    if indicator == "atr":
+        return "ATR", {"symbol": symbol, "interval": interval, "time_period": str(time_period)}
+    raise ValueError(f"Indicator {indicator} not implemented yet.")
+
+
+def _parse_indicator_csv(data: str) -> pd.DataFrame:
+    """Parse an indicator CSV response, keeping values as the API formatted them."""
+    if len(data.strip().split("\n", 1)) < 2:
+        return pd.DataFrame()
+    frame = pd.read_csv(StringIO(data), dtype=str, keep_default_na=False)
+    frame.columns = [col.strip() for col in frame.columns]
+    if "time" in frame.columns:
+        # Rows whose timestamp is not a plain date are skipped, as before
+        frame["_date"] = pd.to_datetime(frame["time"].str.strip(), format="%Y-%m-%d", errors="coerce")
+        frame = frame.dropna(subset=["_date"])
+        for col in frame.columns:
+            if frame[col].dtype == object:
+                frame[col] = frame[col].str.strip()
+    return frame
+
+
+def _fetch_indicator_frame(function_name: str, params: dict) -> pd.DataFrame:
+    """Fetch and parse one indicator response, at most once per day per distinct request.
+
+    Concurrent callers asking for the same request wait for the first one
+    instead of spending another call of the API budget.
+    """
+    key = (function_name, tuple(sorted(params.items())), datetime.now().strftime("%Y-%m-%d"))
+
+    while True:
+        with _responses_lock:
+            if key in _responses:
+                _responses.move_to_end(key)
+                return _responses[key]
+            pending = _inflight.get(key)
+            if pending is None:
+                pending = _inflight[key] = threading.Event()
+                break
+        # Another thread is fetching this response; if it fails we try ourselves
+        pending.wait()
+
+    try:
+        frame = _parse_indicator_csv(_make_api_request(function_name, {**params, "datatype": "csv"}))
+        if "_date" in frame.columns:
+            with _responses_lock:
+                _responses[key] = frame
+                while len(_responses) > _MAX_CACHED_RESPONSES:
+                    _responses.popitem(last=False)
+        return frame
+    finally:
+        with _responses_lock:
+            del _inflight[key]
+        pending.set()
+
 
 def get_indicator(
     symbol: str,
-    indicator: str,
+    indicator: str | list[str],
     curr_date: str,
     look_back_days: int,
     interval: str = "daily",
@@ -14,7 +98,8 @@ def get_indicator(
 
     Args:
         symbol: ticker symbol of the company
-        indicator: technical indicator to get the analysis and report of
+        indicator: technical indicator to get the analysis and report of, or a list
+            (or comma-separated string) of indicators to report one after another
         curr_date: The current trading date you are trading on, YYYY-mm-dd
         look_back_days: how many days to look back
         interval: Time interval (daily, weekly, monthly)
@@ -24,9 +109,16 @@ def get_indicator(
     Returns:
         String containing indicator values and description
     """
-    from datetime import datetime
     from dateutil.relativedelta import relativedelta
 
+    indicators = parse_indicator_list(indicator)
+    if len(indicators) > 1:
+        return "\n\n".join(
+            get_indicator(symbol, name, curr_date, look_back_days, interval, time_period, series_type)
+            for name in indicators
+        )
+    indicator = indicators[0]
+
     supported_indicators = {
         "close_50_sma": ("50 SMA", "close"),
         "close_200_sma": ("200 SMA", "close"),
@@ -72,93 +164,21 @@ def get_indicator(
     if required_series_type:
         series_type = required_series_type
 
+    if indicator == "vwma":
+        # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
+        # In a real implementation, this would need to be calculated from OHLCV data
+        return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
+
     try:
-        # Get indicator data for the period
-        if indicator == "close_50_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "50",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_200_sma":
-            data = _make_api_request("SMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "200",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "close_10_ema":
-            data = _make_api_request("EMA", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "10",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macd":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macds":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "macdh":
-            data = _make_api_request("MACD", {
-                "symbol": symbol,
-                "interval": interval,
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "rsi":
-            data = _make_api_request("RSI", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator in ["boll", "boll_ub", "boll_lb"]:
-            data = _make_api_request("BBANDS", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": "20",
-                "series_type": series_type,
-                "datatype": "csv"
-            })
-        elif indicator == "atr":
-            data = _make_api_request("ATR", {
-                "symbol": symbol,
-                "interval": interval,
-                "time_period": str(time_period),
-                "datatype": "csv"
-            })
-        elif indicator == "vwma":
-            # Alpha Vantage doesn't have direct VWMA, so we'll return an informative message
-            # In a real implementation, this would need to be calculated from OHLCV data
-            return f"## VWMA (Volume Weighted Moving Average) for {symbol}:\n\nVWMA calculation requires OHLCV data and is not directly available from Alpha Vantage API.\nThis indicator would need to be calculated from the raw stock data using volume-weighted price averaging.\n\n{indicator_descriptions.get('vwma', 'No description available.')}"
-        else:
-            return f"Error: Indicator {indicator} not implemented yet."
-
-        # Parse CSV data and extract values for the date range
-        lines = data.strip().split('\n')
-        if len(lines) < 2:
+        # Sibling indicators (macd/macds/macdh, boll/boll_ub/boll_lb) share one API call
+        function_name, params = _indicator_request(indicator, symbol, interval, time_period, series_type)
+        data = _fetch_indicator_frame(function_name, params)
+
+        if data.empty:
             return f"Error: No data returned for {indicator}"
 
-        # Parse header and data
-        header = [col.strip() for col in lines[0].split(',')]
-        try:
-            date_col_idx = header.index('time')
-        except ValueError:
+        header = [col for col in data.columns if col != "_date"]
+        if "time" not in header:
             return f"Error: 'time' column not found in data for {indicator}. Available columns: {header}"
 
         # Map internal indicator names to expected CSV column names from Alpha Vantage
@@ -173,37 +193,18 @@ def get_indicator(
 
         if not target_col_name:
             # Default to the second column if no specific mapping exists
-            value_col_idx = 1
-        else:
-            try:
-                value_col_idx = header.index(target_col_name)
-            except ValueError:
-                return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
-
-        result_data = []
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            values = line.split(',')
-            if len(values) > value_col_idx:
-                try:
-                    date_str = values[date_col_idx].strip()
-                    # Parse the date
-                    date_dt = datetime.strptime(date_str, "%Y-%m-%d")
-
-                    # Check if date is in our range
-                    if before <= date_dt <= curr_date_dt:
-                        value = values[value_col_idx].strip()
-                        result_data.append((date_dt, value))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by date and format output
-        result_data.sort(key=lambda x: x[0])
-
-        ind_string = ""
-        for date_dt, value in result_data:
-            ind_string += f"{date_dt.strftime('%Y-%m-%d')}: {value}\n"
+            target_col_name = header[1]
+        elif target_col_name not in header:
+            return f"Error: Column '{target_col_name}' not found for indicator '{indicator}'. Available columns: {header}"
+
+        dates = data["_date"]
+        in_range = data.loc[(dates >= before) & (dates <= curr_date_dt), ["_date", target_col_name]]
+        in_range = in_range.sort_values("_date", kind="stable")
+
+        ind_string = "".join(
+            f"{date_dt.strftime('%Y-%m-%d')}: {value}\n"
+            for date_dt, value in zip(in_range["_date"], in_range[target_col_name])
+        )
 
         if not ind_string:
             ind_string = "No data available for the specified date range.\n"
@@ -217,6 +218,9 @@ def get_indicator(
 
         return result_str
 
+    except AlphaVantageRateLimitError:
+        # Let route_to_vendor see the rate limit so it can fall back
+        raise
     except Exception as e:
         print(f"Error getting Alpha Vantage indicator data for {indicator}: {e}")
         return f"Error retrieving {indicator} data: {str(e)}"
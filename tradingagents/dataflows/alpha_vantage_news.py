@@ -1,4 +1,4 @@
-from .alpha_vantage_common import _make_api_request, format_datetime_for_api
+from .alpha_vantage_common import _make_api_request, _amake_api_request, format_datetime_for_api
 
 def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
     """Returns live and historical market news & sentiment data from premier news outlets worldwide.
@@ -14,15 +14,20 @@ def get_news(ticker, start_date, end_date) -> dict[str, str] | str:
         Dictionary containing news sentiment data or JSON string.
     """
 
-    params = {
+    return _make_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+async def aget_news(ticker, start_date, end_date) -> dict[str, str] | str:
+    """Async counterpart of get_news."""
+    return await _amake_api_request("NEWS_SENTIMENT", _news_params(ticker, start_date, end_date))
+
+def _news_params(ticker, start_date, end_date) -> dict:
+    return {
         "tickers": ticker,
         "time_from": format_datetime_for_api(start_date),
         "time_to": format_datetime_for_api(end_date),
         "sort": "LATEST",
         "limit": "50",
     }
-    
-    return _make_api_request("NEWS_SENTIMENT", params)
 
 def get_insider_transactions(symbol: str) -> dict[str, str] | str:
     """Returns latest and historical insider transactions by key stakeholders.
@@ -40,4 +45,8 @@ def get_insider_transactions(symbol: str) -> dict[str, str] | str:
         "symbol": symbol,
     }
 
-    return _make_api_request("INSIDER_TRANSACTIONS", params)
\ No newline at end of file
+    return _make_api_request("INSIDER_TRANSACTIONS", params)
+
+async def aget_insider_transactions(symbol: str) -> dict[str, str] | str:
+    """Async counterpart of get_insider_transactions."""
+    return await _amake_api_request("INSIDER_TRANSACTIONS", {"symbol": symbol})
@@ -0,0 +1,44 @@
+import asyncio
+import weakref
+from typing import Dict
+
+import httpx
+
+from .config import get_config
+
+# event loop -> {verify: client}; clients cannot be shared across event loops
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_client(verify: bool = True) -> httpx.AsyncClient:
+    """Return the shared async HTTP client for the running event loop.
+
+    Every async vendor call on a loop goes through the same connection pool,
+    bounded by async_max_connections / async_max_keepalive. verify=False gives
+    a separate client that skips TLS verification (used for URL checks).
+    """
+    loop = asyncio.get_running_loop()
+    loop_clients = _clients.setdefault(loop, {})
+    client = loop_clients.get(verify)
+    if client is None or client.is_closed:
+        config = get_config()
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.get("async_max_connections", 32),
+                max_keepalive_connections=config.get("async_max_keepalive", 16),
+            ),
+            timeout=config.get("async_http_timeout", 30),
+            follow_redirects=True,
+            verify=verify,
+        )
+        loop_clients[verify] = client
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """Close the running loop's clients, e.g. before the loop shuts down."""
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in loop_clients.values():
+        await client.aclose()
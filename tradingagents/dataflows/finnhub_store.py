@@ -0,0 +1,157 @@
+import os
+import glob
+import json
+import sqlite3
+import threading
+from typing import Annotated, Dict, Optional
+
+from .config import get_config
+
+
+class FinnhubStore:
+    """Date-indexed SQLite store of the pre-processed Finnhub JSON files.
+
+    Each {ticker}[_{period}]_data_formatted.json maps a YYYY-MM-DD key to a
+    list of entries. Here every non-empty date becomes one row whose primary
+    key starts with (data_type, ticker, period, date), so a date range is an
+    index range scan and only the rows in range are decoded. A source file is
+    converted the first time it is queried and again whenever it changes.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # source path -> mtime it was converted at
+        self._converted: Dict[str, float] = {}
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS finnhub_entries (
+                data_type TEXT NOT NULL,
+                ticker TEXT NOT NULL,
+                period TEXT NOT NULL,
+                date TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (data_type, ticker, period, date)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS finnhub_sources (
+                source_path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+        self._converted.update(self._conn.execute("SELECT source_path, mtime FROM finnhub_sources"))
+
+    def convert(self, source_path: str, data_type: str, ticker: str, period: str = "") -> int:
+        """Load one Finnhub JSON file into the store, replacing what was there. Returns rows written."""
+        mtime = os.path.getmtime(source_path)
+        with open(source_path, "r") as f:
+            data = json.load(f)
+
+        rows = [
+            (data_type, ticker, period, date, seq, json.dumps(value))
+            for seq, (date, value) in enumerate(data.items())
+            if len(value) > 0
+        ]
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM finnhub_entries WHERE data_type = ? AND ticker = ? AND period = ?",
+                    (data_type, ticker, period),
+                )
+                self._conn.executemany("INSERT OR REPLACE INTO finnhub_entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO finnhub_sources VALUES (?, ?)", (source_path, mtime)
+                )
+            self._converted[source_path] = mtime
+        return len(rows)
+
+    def ensure_converted(self, source_path: str, data_type: str, ticker: str, period: str = "") -> None:
+        try:
+            mtime = os.path.getmtime(source_path)
+        except OSError:
+            if source_path in self._converted:
+                # Source removed after conversion; keep serving the stored copy
+                return
+            raise FileNotFoundError(f"No Finnhub data file at {source_path}")
+
+        if self._converted.get(source_path) != mtime:
+            self.convert(source_path, data_type, ticker, period)
+
+    def query(self, data_type: str, ticker: str, start_date: str, end_date: str, period: str = "") -> dict:
+        """Entries dated within [start_date, end_date], in source file order."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT date, payload FROM finnhub_entries
+                WHERE data_type = ? AND ticker = ? AND period = ? AND date BETWEEN ? AND ?
+                ORDER BY seq
+                """,
+                (data_type, ticker, period, start_date, end_date),
+            ).fetchall()
+        return {date: json.loads(payload) for date, payload in rows}
+
+
+_stores = {}
+_stores_guard = threading.Lock()
+
+
+def get_finnhub_store() -> FinnhubStore:
+    """Return the store for the configured data_cache_dir."""
+    db_path = os.path.join(get_config()["data_cache_dir"], "finnhub_store.sqlite")
+    with _stores_guard:
+        if db_path not in _stores:
+            _stores[db_path] = FinnhubStore(db_path)
+        return _stores[db_path]
+
+
+def finnhub_source_path(data_dir: str, data_type: str, ticker: str, period: Optional[str] = None) -> str:
+    if period:
+        return os.path.join(data_dir, "finnhub_data", data_type, f"{ticker}_{period}_data_formatted.json")
+    return os.path.join(data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json")
+
+
+def query_finnhub_range(
+    ticker: Annotated[str, "ticker symbol"],
+    start_date: Annotated[str, "Start date in YYYY-MM-DD format"],
+    end_date: Annotated[str, "End date in YYYY-MM-DD format"],
+    data_type: Annotated[str, "insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported"],
+    data_dir: Annotated[str, "Directory where the data is saved"],
+    period: Annotated[Optional[str], "annual or quarterly, if the data is per period"] = None,
+) -> dict:
+    """Non-empty Finnhub entries for a ticker dated within [start_date, end_date]."""
+    store = get_finnhub_store()
+    store.ensure_converted(finnhub_source_path(data_dir, data_type, ticker, period), data_type, ticker, period or "")
+    return store.query(data_type, ticker, start_date, end_date, period or "")
+
+
+def convert_finnhub_data(data_dir: Annotated[str, "Directory where the data is saved"]) -> int:
+    """One-shot conversion of every Finnhub JSON file under data_dir. Returns rows written."""
+    store = get_finnhub_store()
+    total = 0
+    pattern = os.path.join(data_dir, "finnhub_data", "*", "*_data_formatted.json")
+    for source_path in sorted(glob.glob(pattern)):
+        data_type = os.path.basename(os.path.dirname(source_path))
+        name = os.path.basename(source_path)[: -len("_data_formatted.json")]
+        ticker, period = name, ""
+        for candidate in ("annual", "quarterly"):
+            if name.endswith(f"_{candidate}"):
+                ticker, period = name[: -len(candidate) - 1], candidate
+        total += store.convert(source_path, data_type, ticker, period)
+        print(f"INFO: Converted {source_path}")
+    return total
+
+
+if __name__ == "__main__":
+    rows = convert_finnhub_data(get_config()["data_dir"])
+    print(f"Converted {rows} dated entries into {get_finnhub_store().db_path}")
@@ -1,7 +1,7 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from .googlenews_utils import getNewsData
+from .googlenews_utils import getNewsData, agetNewsData
 
 
 def get_google_news(
@@ -9,14 +9,32 @@ def get_google_news(
     curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
+    query, before = _news_window(query, curr_date, look_back_days)
+    news_results = getNewsData(query, before, curr_date)
+    return _format_news(query, before, curr_date, news_results)
+
+
+async def aget_google_news(
+    query: Annotated[str, "Query to search with"],
+    curr_date: Annotated[str, "Curr date in yyyy-mm-dd format"],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """Async counterpart of get_google_news."""
+    query, before = _news_window(query, curr_date, look_back_days)
+    news_results = await agetNewsData(query, before, curr_date)
+    return _format_news(query, before, curr_date, news_results)
+
+
+def _news_window(query, curr_date, look_back_days):
     query = query.replace(" ", "+")
 
     start_date = datetime.strptime(curr_date, "%Y-%m-%d")
     before = start_date - relativedelta(days=look_back_days)
     before = before.strftime("%Y-%m-%d")
+    return query, before
 
-    news_results = getNewsData(query, before, curr_date)
 
+def _format_news(query, before, curr_date, news_results):
     news_str = ""
 
     for news in news_results:
@@ -47,4 +65,15 @@ def get_google_news_with_dates(
     look_back_days = (end - start).days
 
     # Use end_date as curr_date
-    return get_google_news(ticker, end_date, look_back_days)
\ No newline at end of file
+    return get_google_news(ticker, end_date, look_back_days)
+
+
+async def aget_google_news_with_dates(
+    ticker: Annotated[str, "Ticker symbol"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format"],
+) -> str:
+    """Async counterpart of get_google_news_with_dates."""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    return await aget_google_news(ticker, end_date, (end - start).days)
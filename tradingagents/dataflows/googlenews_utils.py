@@ -1,7 +1,15 @@
+import os
 import json
+import asyncio
+import hashlib
+import threading
+import weakref
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 import time
 import random
 from tenacity import (
@@ -12,6 +20,88 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .async_http import get_async_client
+from .keyed_locks import KeyedLocks
+
+
+# Requests to one host start at least this far apart, plus random jitter
+DEFAULT_MIN_INTERVAL = 1.5
+DEFAULT_JITTER = 1.5
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+_session = requests.Session()
+
+_budgets = {}
+_budgets_guard = threading.Lock()
+
+# One lock per cache entry in use, so concurrent scrapes of the same query run once
+_scrape_locks = KeyedLocks()
+
+
+class HostBudget:
+    """Politeness budget for one host: spaced request starts and a cap on requests in flight."""
+
+    def __init__(self, min_interval: float, jitter: float, max_in_flight: int):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self.max_in_flight = max_in_flight
+        self._slots = threading.Semaphore(max_in_flight)
+        # asyncio semaphores are bound to their event loop, so async callers get one per loop
+        self._async_slots = weakref.WeakKeyDictionary()
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next start time and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.min_interval + random.uniform(0, self.jitter)
+        return start_at - now
+
+    @contextmanager
+    def slot(self):
+        with self._slots:
+            wait = self.reserve()
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+    @asynccontextmanager
+    async def aslot(self):
+        """Async counterpart of slot: same start spacing, same cap on requests in flight per event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_slots.get(loop)
+            if slots is None:
+                slots = self._async_slots[loop] = asyncio.Semaphore(self.max_in_flight)
+        async with slots:
+            wait = self.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+
+
+def get_host_budget(url: str) -> HostBudget:
+    config = get_config()
+    host = urlparse(url).netloc
+    with _budgets_guard:
+        if host not in _budgets:
+            _budgets[host] = HostBudget(
+                config.get("google_news_min_interval", DEFAULT_MIN_INTERVAL),
+                config.get("google_news_jitter", DEFAULT_JITTER),
+                max(1, config.get("google_news_pipeline_depth", 2)),
+            )
+        return _budgets[host]
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -25,84 +115,233 @@ def is_rate_limited(response):
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    # Wait for this host's politeness budget; the delay is randomized to avoid detection
+    with get_host_budget(url).slot():
+        response = _session.get(url, headers=headers, timeout=30)
     return response
 
 
+@retry(
+    retry=(retry_if_result(is_rate_limited)),
+    wait=wait_exponential(multiplier=1, min=4, max=60),
+    stop=stop_after_attempt(5),
+)
+async def amake_request(url, headers):
+    """Async counterpart of make_request, on the shared async HTTP client, within the host's politeness budget"""
+    async with get_host_budget(url).aslot():
+        return await get_async_client().get(url, headers=headers, timeout=30)
+
+
+def _cache_path(query, start_date, end_date):
+    key = json.dumps([query, start_date, end_date])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(get_config()["data_cache_dir"], "google_news", f"{digest}.json")
+
+
+def _load_cached(path):
+    """Cached results for a scrape, or None if missing or expired."""
+    try:
+        with open(path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    expires_at = cached.get("expires_at")
+    if expires_at is not None and expires_at < time.time():
+        return None
+    return cached["results"]
+
+
+def _store_cached(path, end_date, results):
+    # Results for a window that closed before today do not change any more
+    ended = datetime.strptime(end_date, "%m/%d/%Y").date() < datetime.now().date()
+    ttl = get_config().get("google_news_cache_ttl", 6 * 60 * 60)
+    if not ended and not ttl:
+        return
+    expires_at = None if ended else time.time() + ttl
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"expires_at": expires_at, "results": results}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: could not cache Google News results: {e}")
+
+
+def _parse_results(results_on_page):
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+    return news_results
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
     query: str - search query
     start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
     end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    Parsed results of complete scrapes are cached on disk per (query, date
+    range), and concurrent callers asking for the same scrape share one. Pages are fetched ahead of
+    parsing, up to google_news_pipeline_depth at a time, within the host's
+    politeness budget.
+    """
+    start_date, end_date = _normalize_dates(start_date, end_date)
+
+    cache_path = _cache_path(query, start_date, end_date)
+    with _scrape_locks.hold(cache_path):
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            print(f"CACHE: Google News results for '{query}' served from cache")
+            return cached
+
+        news_results, complete = _scrape(query, start_date, end_date)
+        # A scrape cut short by a failed page is returned but never cached
+        if news_results and complete:
+            _store_cached(cache_path, end_date, news_results)
+        return news_results
+
+
+async def agetNewsData(query, start_date, end_date):
+    """
+    Async counterpart of getNewsData, sharing its disk cache and host budget.
+    Pages are fetched ahead of parsing as asyncio tasks, up to
+    google_news_pipeline_depth at a time.
     """
+    start_date, end_date = _normalize_dates(start_date, end_date)
+
+    cache_path = _cache_path(query, start_date, end_date)
+    cached = _load_cached(cache_path)
+    if cached is not None:
+        print(f"CACHE: Google News results for '{query}' served from cache")
+        return cached
+
+    news_results, complete = await _ascrape(query, start_date, end_date)
+    if news_results and complete:
+        _store_cached(cache_path, end_date, news_results)
+    return news_results
+
+
+def _normalize_dates(start_date, end_date):
     if "-" in start_date:
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
         start_date = start_date.strftime("%m/%d/%Y")
     if "-" in end_date:
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
         end_date = end_date.strftime("%m/%d/%Y")
+    return start_date, end_date
+
+
+def _page_url(query, start_date, end_date, page):
+    offset = page * 10
+    return (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
+def _parse_page(content):
+    """(results, has_next) for one page of search results."""
+    # lxml is always present (parsel depends on it) and parses much faster
+    soup = BeautifulSoup(content, "lxml")
+    results_on_page = soup.select("div.SoaBEf")
+    if not results_on_page:
+        return [], False
+    # Check for the "Next" link (pagination)
+    return _parse_results(results_on_page), soup.find("a", id="pnnext") is not None
+
+
+async def _ascrape(query, start_date, end_date):
+    """(results, complete) for a search; complete is False when a page failed and pagination stopped early."""
+    def fetch(page):
+        return asyncio.ensure_future(amake_request(_page_url(query, start_date, end_date, page), HEADERS))
+
+    depth = max(1, get_config().get("google_news_pipeline_depth", 2))
+    pending = {page: fetch(page) for page in range(depth)}
 
     news_results = []
     page = 0
-    while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
+    try:
+        while True:
+            try:
+                response = await pending.pop(page)
+                results, has_next = _parse_page(response.content)
+                if not results and not has_next:
+                    break  # No more results found
+                news_results.extend(results)
+                if not has_next:
+                    break
 
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
-                break
-
-            page += 1
+                page += 1
+                # Keep the pipeline full: fetch the page after those already in flight
+                pending[page + depth - 1] = fetch(page + depth - 1)
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                return news_results, False
+    finally:
+        # Pages fetched ahead of the last one are not needed
+        for task in pending.values():
+            task.cancel()
 
-    return news_results
+    return news_results, True
+
+
+def _scrape(query, start_date, end_date):
+    """(results, complete) for a search; complete is False when a page failed and pagination stopped early."""
+    headers = HEADERS
+
+    def page_url(page):
+        return _page_url(query, start_date, end_date, page)
+
+    depth = max(1, get_config().get("google_news_pipeline_depth", 2))
+    executor = ThreadPoolExecutor(max_workers=depth)
+    pending = {page: executor.submit(make_request, page_url(page), headers) for page in range(depth)}
+
+    news_results = []
+    page = 0
+    try:
+        while True:
+            try:
+                response = pending.pop(page).result()
+                results, has_next = _parse_page(response.content)
+                if not results and not has_next:
+                    break  # No more results found
+                news_results.extend(results)
+                if not has_next:
+                    break
+
+                page += 1
+                # Keep the pipeline full: fetch the page after those already in flight
+                pending[page + depth - 1] = executor.submit(make_request, page_url(page + depth - 1), headers)
+
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                return news_results, False
+    finally:
+        # Pages fetched ahead of the last one are not needed
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    return news_results, True
@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class IndicatorCache:
+    """Process-wide LRU cache of computed indicator series.
+
+    Entries are keyed on (source, symbol, indicator, last bar timestamp,
+    fingerprint of the price history) so a cached series is only reused while
+    the underlying prices are unchanged, including when a history is rewritten
+    in place (restated or split-adjusted bars, a different local file).
+    Storing a series for a newer history drops the stale one.
+    Total size is bounded by a byte budget; least recently used series are
+    evicted first.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[pd.Series, int]]" = OrderedDict()
+        # (source, symbol, indicator) -> full key of the live entry
+        self._latest: Dict[Tuple, Tuple] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def fingerprint(prices: pd.DataFrame) -> Tuple[int, int]:
+        """(row count, content hash) of a price history."""
+        digest = int(pd.util.hash_pandas_object(prices, index=False).sum())
+        return len(prices), digest
+
+    @staticmethod
+    def make_key(source: str, symbol: str, indicator: str, last_bar: Hashable, fingerprint: Tuple[int, int]) -> Tuple:
+        return (source, symbol.upper(), indicator, pd.Timestamp(last_bar), fingerprint)
+
+    def get(self, key: Tuple) -> Optional[pd.Series]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple, series: pd.Series) -> None:
+        size = int(series.memory_usage(index=True, deep=True))
+        with self._lock:
+            stale_key = self._latest.get(key[:3])
+            if stale_key is not None and stale_key != key:
+                self._remove(stale_key)
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (series, size)
+            self._latest[key[:3]] = key
+            self._bytes += size
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Tuple) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+        if self._latest.get(key[:3]) == key:
+            del self._latest[key[:3]]
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+
+_cache: Optional[IndicatorCache] = None
+_cache_guard = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Return the shared indicator cache, sized from the current config."""
+    global _cache
+    max_bytes = get_config().get("indicator_cache_max_bytes", DEFAULT_MAX_BYTES)
+    with _cache_guard:
+        if _cache is None:
+            _cache = IndicatorCache(max_bytes)
+        elif _cache.max_bytes != max_bytes:
+            _cache.resize(max_bytes)
+        return _cache
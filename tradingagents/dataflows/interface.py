@@ -1,10 +1,16 @@
 from typing import Annotated
+import copy
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait, FIRST_COMPLETED
 
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
 from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
-from .google import get_google_news, get_google_news_with_dates
+from .google import get_google_news, get_google_news_with_dates, aget_google_news_with_dates
 from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
+from .openai import aget_stock_news_openai, aget_global_news_openai, aget_fundamentals_openai
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
     get_indicator as get_alpha_vantage_indicator,
@@ -13,9 +19,18 @@ from .alpha_vantage import (
     get_cashflow as get_alpha_vantage_cashflow,
     get_income_statement as get_alpha_vantage_income_statement,
     get_insider_transactions as get_alpha_vantage_insider_transactions,
-    get_news as get_alpha_vantage_news
+    get_news as get_alpha_vantage_news,
+    aget_stock as aget_alpha_vantage_stock,
+    aget_fundamentals as aget_alpha_vantage_fundamentals,
+    aget_balance_sheet as aget_alpha_vantage_balance_sheet,
+    aget_cashflow as aget_alpha_vantage_cashflow,
+    aget_income_statement as aget_alpha_vantage_income_statement,
+    aget_insider_transactions as aget_alpha_vantage_insider_transactions,
+    aget_news as aget_alpha_vantage_news,
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .vendor_cache import VendorResponseCache, get_vendor_cache, is_cacheable_result, MISS
+from .vendor_health import get_vendor_health, classify_failure
 
 # Configuration and routing logic
 from .config import get_config
@@ -116,6 +131,22 @@ VENDOR_METHODS = {
     },
 }
 
+# Native async counterparts of the HTTP-based implementations, used by aroute_to_vendor.
+# Implementations without one run on the vendor thread pool instead.
+ASYNC_IMPLS = {
+    get_alpha_vantage_stock: aget_alpha_vantage_stock,
+    get_alpha_vantage_fundamentals: aget_alpha_vantage_fundamentals,
+    get_alpha_vantage_balance_sheet: aget_alpha_vantage_balance_sheet,
+    get_alpha_vantage_cashflow: aget_alpha_vantage_cashflow,
+    get_alpha_vantage_income_statement: aget_alpha_vantage_income_statement,
+    get_alpha_vantage_insider_transactions: aget_alpha_vantage_insider_transactions,
+    get_alpha_vantage_news: aget_alpha_vantage_news,
+    get_google_news_with_dates: aget_google_news_with_dates,
+    get_stock_news_openai: aget_stock_news_openai,
+    get_global_news_openai: aget_global_news_openai,
+    get_fundamentals_openai: aget_fundamentals_openai,
+}
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
     for category, info in TOOLS_CATEGORIES.items():
@@ -138,10 +169,169 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
-def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+def _invoke_vendor_impl(method: str, vendor: str, impl_func, args, kwargs):
+    """Call the implementation itself and record the outcome on the vendor health scoreboard.
+
+    Raises CircuitOpenError without calling when the vendor's circuit refuses the call.
+    """
+    health = get_vendor_health()
+    trials = health.admit(vendor, method)
+    started = time.monotonic()
+    try:
+        result = impl_func(*args, **kwargs)
+    except Exception as e:
+        _record_vendor_error(method, vendor, e, trials)
+        raise
+    health.record_success(vendor, method, time.monotonic() - started)
+    return result
+
+def _record_vendor_timeout(method: str, vendor: str, impl_func, timeout) -> None:
+    get_vendor_health().record_failure(
+        vendor, method, TimeoutError(f"{impl_func.__name__} did not answer within {timeout}s")
+    )
+
+def _record_vendor_error(method: str, vendor: str, error: Exception, trials) -> None:
+    """Hold rate limits, transport errors and server errors against the vendor; errors in the call itself are not."""
+    kind = classify_failure(error)
+    if kind is not None:
+        get_vendor_health().record_failure(vendor, method, error, rate_limited=kind == "rate_limit")
+    elif trials:
+        # Says nothing about the vendor, so the next caller gets the trial instead
+        get_vendor_health().end_trial(trials)
+
+def _call_vendor_impl(method: str, category: str, vendor: str, impl_func, args, kwargs, use_cache: bool):
+    """Call one vendor implementation, going through the response cache when enabled."""
+    cache = get_vendor_cache() if use_cache else None
+    if cache is None:
+        return _invoke_vendor_impl(method, vendor, impl_func, args, kwargs)
+
+    key, normalized_args = cache.make_key(method, vendor, impl_func, args, kwargs)
+    cached = cache.get(key)
+    if cached is not MISS:
+        print(f"CACHE: {impl_func.__name__} from vendor '{vendor}' served from cache")
+        return cached
+
+    result = _invoke_vendor_impl(method, vendor, impl_func, args, kwargs)
+    if is_cacheable_result(result):
+        cache.put(key, method, vendor, result, cache.ttl_for(category, normalized_args))
+    return result
+
+def _try_vendor_impl(method: str, category: str, vendor: str, impl_func, args, kwargs, use_cache: bool):
+    """Call one implementation and log the outcome. Returns (succeeded, result)."""
+    try:
+        print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor}'...")
+        result = _call_vendor_impl(method, category, vendor, impl_func, args, kwargs, use_cache)
+        print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor}' completed successfully")
+        return True, result
+    except AlphaVantageRateLimitError as e:
+        if vendor == "alpha_vantage":
+            print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
+            print(f"DEBUG: Rate limit details: {e}")
+        return False, None
+    except Exception as e:
+        # Log error but continue with other implementations
+        print(f"FAILED: {impl_func.__name__} from vendor '{vendor}' failed: {e}")
+        return False, None
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared pool for vendor calls. Calls that time out are abandoned, not joined."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_config().get("vendor_max_workers", 16),
+                thread_name_prefix="vendor",
+            )
+        return _executor
+
+class _VendorRun:
+    """All implementations of one vendor for a call, run inline or on the shared pool.
+
+    Each call's timeout runs from the moment a pool worker picks it up, so
+    time spent queued behind other vendor calls does not count against it.
+    """
+
+    def __init__(self, method, category, vendor, args, kwargs, use_cache, concurrent):
+        self.method = method
+        self.vendor = vendor
+        vendor_impl = VENDOR_METHODS[method][vendor]
+        self.impls = vendor_impl if isinstance(vendor_impl, list) else [vendor_impl]
+        self._call = lambda impl: _try_vendor_impl(
+            method, category, vendor, impl, args, kwargs, use_cache
+        )
+        self.futures = []
+        self.started_at = [None] * len(self.impls)
+        self._running = [threading.Event() for _ in self.impls]
+
+        if len(self.impls) > 1:
+            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(self.impls)} functions")
+
+        if concurrent:
+            executor = _get_executor()
+            self.futures = [executor.submit(self._run, index) for index in range(len(self.impls))]
+
+    def _run(self, index):
+        self.started_at[index] = time.monotonic()
+        self._running[index].set()
+        return self._call(self.impls[index])
+
+    def done(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    def expired(self, timeout) -> bool:
+        """Whether every unfinished call has been running for longer than timeout."""
+        if timeout is None:
+            return False
+        now = time.monotonic()
+        return all(
+            future.done() or (started_at is not None and now >= started_at + timeout)
+            for future, started_at in zip(self.futures, self.started_at)
+        )
+
+    def remaining(self, timeout):
+        """Seconds until the next unfinished call could time out; a queued call has the full timeout ahead."""
+        if timeout is None:
+            return None
+        now = time.monotonic()
+        return min(
+            (
+                timeout if started_at is None else max(0.0, started_at + timeout - now)
+                for future, started_at in zip(self.futures, self.started_at)
+                if not future.done()
+            ),
+            default=0.0,
+        )
+
+    def _remaining_for(self, index, timeout):
+        """Seconds call index has left once it is running; waits while it is still queued."""
+        if timeout is None:
+            return None
+        self._running[index].wait()
+        return max(0.0, self.started_at[index] + timeout - time.monotonic())
+
+    def results(self, timeout) -> list:
+        """Results of the implementations that succeeded, in declaration order."""
+        if not self.futures:
+            outcomes = [self._call(impl) for impl in self.impls]
+        else:
+            outcomes = []
+            for index, (impl, future) in enumerate(zip(self.impls, self.futures)):
+                try:
+                    outcomes.append(future.result(timeout=self._remaining_for(index, timeout)))
+                except FuturesTimeoutError:
+                    print(f"TIMEOUT: {impl.__name__} from vendor '{self.vendor}' did not answer within {timeout}s")
+                    _record_vendor_timeout(self.method, self.vendor, impl, timeout)
+                    outcomes.append((False, None))
+        return [result for succeeded, result in outcomes if succeeded]
+
+def _plan_vendors(method: str, skip_vendors=()):
+    """Returns (category, primary vendors, candidate vendors in the order to try them)."""
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
+    config = get_config()
 
     # Handle comma-separated vendors
     primary_vendors = [v.strip() for v in vendor_config.split(',')]
@@ -163,82 +353,374 @@ def route_to_vendor(method: str, *args, **kwargs):
     fallback_str = " → ".join(fallback_vendors)
     print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
 
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
-
+    candidate_vendors = []
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
                 print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
             continue
+        if vendor in skip_vendors:
+            print(f"INFO: Vendor '{vendor}' excluded for this call of '{method}'")
+            continue
+        candidate_vendors.append(vendor)
 
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
+    if config.get("vendor_circuit_breaker_enabled", True):
+        # Skip vendors with an open circuit and rank the fallbacks by recent health
+        candidate_vendors = get_vendor_health().order_vendors(method, primary_vendors, candidate_vendors)
 
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
+    return category, primary_vendors, candidate_vendors
 
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+def _combine_results(method: str, results: list, vendor_attempt_count: int):
+    # Final result summary
+    if not results:
+        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
+        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
+    else:
+        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+
+    # Return single result if only one, otherwise concatenate as string
+    if len(results) == 1:
+        return results[0]
+    else:
+        # Convert all results to strings and concatenate
+        return '\n'.join(str(result) for result in results)
+
+class _Flight:
+    """One vendor execution that concurrent identical calls wait on."""
 
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.joined = 0
+
+_flights = {}
+_flights_lock = threading.Lock()
+_coalesced_calls = 0
+
+def _flight_key(method: str, args, kwargs, use_cache: bool, skip_vendors) -> str:
+    vendor_impl = next(iter(VENDOR_METHODS[method].values()))
+    impl_func = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
+    # Bound and normalized like vendor cache keys, so equivalent spellings coalesce
+    key, _ = VendorResponseCache.make_key(method, "*", impl_func, args, kwargs)
+    return f"{key}|use_cache={use_cache}|skip={sorted(skip_vendors)}"
+
+def get_coalesced_call_count() -> int:
+    """Number of route_to_vendor calls served by joining an identical call already in flight."""
+    return _coalesced_calls
+
+def route_to_vendor(method: str, *args, use_cache: bool = True, skip_vendors=(), **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Concurrent identical calls (same method and normalized arguments) share
+    one vendor execution and its result or error, unless
+    vendor_single_flight_enabled is off. Callers that joined receive a deep
+    copy of the result.
+
+    Responses are served from the on-disk vendor cache when possible; pass
+    use_cache=False to force a fresh call. Vendors in skip_vendors are left
+    out of the whole fallback chain for this call.
+
+    With vendor_concurrency_enabled, vendor calls run on a shared thread pool:
+    multi-vendor configs and multi-implementation vendors fan out at once,
+    every call is bounded by vendor_call_timeout, and single-vendor configs
+    start the first fallback if the primary is slower than vendor_hedge_after.
+    Results are always returned in fallback order.
+
+    Vendors whose circuit is open on the health scoreboard (recent rate limits
+    or repeated failures) are skipped, and non-primary fallbacks are ordered
+    by recent success rate and latency.
+    """
+    global _coalesced_calls
+    if method not in VENDOR_METHODS or not get_config().get("vendor_single_flight_enabled", True):
+        return _route_to_vendor(method, args, kwargs, use_cache, skip_vendors)
+
+    key = _flight_key(method, args, kwargs, use_cache, skip_vendors)
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
         else:
-            vendor_methods = [(vendor_impl, vendor)]
+            flight.joined += 1
+            _coalesced_calls += 1
 
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
-
-        # Add this vendor's results
+    if not leader:
+        print(f"SINGLEFLIGHT: {method} joined an identical call in flight ({_coalesced_calls} calls coalesced so far)")
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        # Each waiter gets its own copy, so a caller mutating a DataFrame or list does not change the others'
+        return copy.deepcopy(flight.result)
+
+    try:
+        flight.result = _route_to_vendor(method, args, kwargs, use_cache, skip_vendors)
+        return flight.result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+        if flight.joined:
+            print(f"SINGLEFLIGHT: {method} result shared with {flight.joined} waiting call(s)")
+
+def _route_to_vendor(method: str, args, kwargs, use_cache: bool, skip_vendors=()):
+    category, primary_vendors, candidate_vendors = _plan_vendors(method, skip_vendors)
+    config = get_config()
+
+    concurrent = config.get("vendor_concurrency_enabled", True)
+    call_timeout = config.get("vendor_call_timeout") if concurrent else None
+    hedge_after = config.get("vendor_hedge_after") if concurrent else None
+
+    # Track results and execution state
+    results = []
+    vendor_attempt_count = 0
+
+    def start(vendor):
+        nonlocal vendor_attempt_count
+        vendor_attempt_count += 1
+        vendor_type = "PRIMARY" if vendor in primary_vendors else "FALLBACK"
+        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+        return _VendorRun(method, category, vendor, args, kwargs, use_cache, concurrent)
+
+    def record(run, vendor_results) -> bool:
         if vendor_results:
             results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
+            print(f"SUCCESS: Vendor '{run.vendor}' succeeded - Got {len(vendor_results)} result(s)")
+            return True
+        print(f"FAILED: Vendor '{run.vendor}' produced no results")
+        return False
+
+    remaining_vendors = list(candidate_vendors)
+
+    if concurrent and len(primary_vendors) > 1:
+        # Multiple vendor configs (comma-separated) collect from every source, so query them all at once
+        runs = [start(vendor) for vendor in remaining_vendors]
+        for run in runs:
+            record(run, run.results(call_timeout))
+        remaining_vendors = []
+
+    elif hedge_after and len(remaining_vendors) > 1:
+        primary_run = start(remaining_vendors.pop(0))
+        wait(primary_run.futures, timeout=hedge_after)
+
+        if primary_run.done():
+            succeeded = record(primary_run, primary_run.results(call_timeout))
+        else:
+            print(f"HEDGE: Vendor '{primary_run.vendor}' slower than {hedge_after}s, starting '{remaining_vendors[0]}' in parallel")
+            hedge_run = start(remaining_vendors.pop(0))
+            succeeded = _first_successful_run([primary_run, hedge_run], call_timeout, record)
+
+        if succeeded:
+            print(f"DEBUG: Stopping after successful vendor (single-vendor config)")
+            remaining_vendors = []
+
+    for vendor in remaining_vendors:
+        run = start(vendor)
+        if record(run, run.results(call_timeout)):
             # Stopping logic: Stop after first successful vendor for single-vendor configs
             # Multiple vendor configs (comma-separated) may want to collect from multiple sources
             if len(primary_vendors) == 1:
                 print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
                 break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
 
-    # Final result summary
-    if not results:
-        print(f"FAILURE: All {vendor_attempt_count} vendor attempts failed for method '{method}'")
-        raise RuntimeError(f"All vendor implementations failed for method '{method}'")
-    else:
-        print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
+    return _combine_results(method, results, vendor_attempt_count)
 
-    # Return single result if only one, otherwise concatenate as string
-    if len(results) == 1:
-        return results[0]
+def _first_successful_run(runs, call_timeout, record) -> bool:
+    """Wait on racing vendor runs and keep the first one that finishes with results.
+
+    When several finish together, the earlier run in the list (the primary) wins.
+    """
+    pending = list(runs)
+    while pending:
+        timeouts = [run.remaining(call_timeout) for run in pending]
+        wait_timeout = None if None in timeouts else min(timeouts)
+        wait(
+            [future for run in pending for future in run.futures],
+            timeout=wait_timeout,
+            return_when=FIRST_COMPLETED,
+        )
+
+        for run in list(pending):
+            if run.done() or run.expired(call_timeout):
+                pending.remove(run)
+                if record(run, run.results(call_timeout)):
+                    return True
+    return False
+
+async def _ainvoke_vendor_impl(method: str, vendor: str, impl_func, args, kwargs, call_timeout):
+    """Await the native async implementation, or run the sync one on the vendor pool, within call_timeout."""
+    async_impl = ASYNC_IMPLS.get(impl_func)
+    if async_impl is None:
+        loop = asyncio.get_running_loop()
+        running = asyncio.Event()
+
+        def run():
+            loop.call_soon_threadsafe(running.set)
+            return _invoke_vendor_impl(method, vendor, impl_func, args, kwargs)
+
+        call = loop.run_in_executor(_get_executor(), run)
+        # The timeout starts once a pool worker picks the call up, not while it is queued
+        await running.wait()
+        try:
+            # A call that times out keeps running on the pool; only the timeout is recorded here
+            return await asyncio.wait_for(asyncio.shield(call), call_timeout)
+        except asyncio.TimeoutError:
+            _record_vendor_timeout(method, vendor, impl_func, call_timeout)
+            raise
+
+    health = get_vendor_health()
+    trials = health.admit(vendor, method)
+    started = time.monotonic()
+    try:
+        result = await asyncio.wait_for(async_impl(*args, **kwargs), call_timeout)
+    except asyncio.CancelledError:
+        health.end_trial(trials)
+        raise
+    except Exception as e:
+        _record_vendor_error(method, vendor, e, trials)
+        raise
+    health.record_success(vendor, method, time.monotonic() - started)
+    return result
+
+async def _acall_vendor_impl(method: str, category: str, vendor: str, impl_func, args, kwargs, use_cache: bool, call_timeout):
+    """Async counterpart of _call_vendor_impl, sharing its cache entries."""
+    cache = get_vendor_cache() if use_cache else None
+    if cache is None:
+        return await _ainvoke_vendor_impl(method, vendor, impl_func, args, kwargs, call_timeout)
+
+    key, normalized_args = cache.make_key(method, vendor, impl_func, args, kwargs)
+    cached = cache.get(key)
+    if cached is not MISS:
+        print(f"CACHE: {impl_func.__name__} from vendor '{vendor}' served from cache")
+        return cached
+
+    result = await _ainvoke_vendor_impl(method, vendor, impl_func, args, kwargs, call_timeout)
+    if is_cacheable_result(result):
+        cache.put(key, method, vendor, result, cache.ttl_for(category, normalized_args))
+    return result
+
+async def _atry_vendor_impl(method: str, category: str, vendor: str, impl_func, args, kwargs, use_cache: bool, call_timeout):
+    """Async counterpart of _try_vendor_impl. Returns (succeeded, result)."""
+    try:
+        print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor}'...")
+        result = await _acall_vendor_impl(method, category, vendor, impl_func, args, kwargs, use_cache, call_timeout)
+        print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor}' completed successfully")
+        return True, result
+    except AlphaVantageRateLimitError as e:
+        if vendor == "alpha_vantage":
+            print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
+            print(f"DEBUG: Rate limit details: {e}")
+        return False, None
+    except asyncio.TimeoutError:
+        print(f"TIMEOUT: {impl_func.__name__} from vendor '{vendor}' did not answer within {call_timeout}s")
+        return False, None
+    except Exception as e:
+        # Log error but continue with other implementations
+        print(f"FAILED: {impl_func.__name__} from vendor '{vendor}' failed: {e}")
+        return False, None
+
+async def _arun_vendor(method, category, vendor, args, kwargs, use_cache, concurrent, call_timeout) -> list:
+    """Results of one vendor's implementations that succeeded, in declaration order."""
+    vendor_impl = VENDOR_METHODS[method][vendor]
+    impls = vendor_impl if isinstance(vendor_impl, list) else [vendor_impl]
+    if len(impls) > 1:
+        print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(impls)} functions")
+
+    calls = [
+        _atry_vendor_impl(method, category, vendor, impl, args, kwargs, use_cache, call_timeout)
+        for impl in impls
+    ]
+    if concurrent:
+        outcomes = await asyncio.gather(*calls)
     else:
-        # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        outcomes = [await call for call in calls]
+    return [result for succeeded, result in outcomes if succeeded]
+
+async def aroute_to_vendor(method: str, *args, use_cache: bool = True, skip_vendors=(), **kwargs):
+    """Async counterpart of route_to_vendor, with the same vendor ordering, cache and results.
+
+    HTTP-based implementations (see ASYNC_IMPLS) run natively on the shared
+    async HTTP client, so many calls overlap on one event loop without a
+    thread each; the rest run on the vendor thread pool. Comma-separated
+    vendor configs are gathered at once, and single-vendor configs hedge
+    with the first fallback after vendor_hedge_after, as in route_to_vendor.
+    """
+    category, primary_vendors, candidate_vendors = _plan_vendors(method, skip_vendors)
+    config = get_config()
+
+    concurrent = config.get("vendor_concurrency_enabled", True)
+    call_timeout = config.get("vendor_call_timeout") if concurrent else None
+    hedge_after = config.get("vendor_hedge_after") if concurrent else None
+
+    results = []
+    vendor_attempt_count = 0
+
+    def start(vendor):
+        nonlocal vendor_attempt_count
+        vendor_attempt_count += 1
+        vendor_type = "PRIMARY" if vendor in primary_vendors else "FALLBACK"
+        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+        return asyncio.ensure_future(
+            _arun_vendor(method, category, vendor, args, kwargs, use_cache, concurrent, call_timeout)
+        )
+
+    def record(vendor, vendor_results) -> bool:
+        if vendor_results:
+            results.extend(vendor_results)
+            print(f"SUCCESS: Vendor '{vendor}' succeeded - Got {len(vendor_results)} result(s)")
+            return True
+        print(f"FAILED: Vendor '{vendor}' produced no results")
+        return False
+
+    remaining_vendors = list(candidate_vendors)
+
+    if concurrent and len(primary_vendors) > 1:
+        # Multiple vendor configs (comma-separated) collect from every source, so query them all at once
+        runs = [(vendor, start(vendor)) for vendor in remaining_vendors]
+        for vendor, run in runs:
+            record(vendor, await run)
+        remaining_vendors = []
+
+    elif hedge_after and len(remaining_vendors) > 1:
+        primary_vendor = remaining_vendors.pop(0)
+        primary_run = start(primary_vendor)
+        await asyncio.wait({primary_run}, timeout=hedge_after)
+
+        if primary_run.done():
+            succeeded = record(primary_vendor, primary_run.result())
+        else:
+            print(f"HEDGE: Vendor '{primary_vendor}' slower than {hedge_after}s, starting '{remaining_vendors[0]}' in parallel")
+            hedge_vendor = remaining_vendors.pop(0)
+            pending = [(primary_vendor, primary_run), (hedge_vendor, start(hedge_vendor))]
+            succeeded = False
+            try:
+                # When both finish together, the primary wins
+                while pending and not succeeded:
+                    await asyncio.wait([run for _, run in pending], return_when=asyncio.FIRST_COMPLETED)
+                    for vendor, run in list(pending):
+                        if run.done():
+                            pending.remove((vendor, run))
+                            if record(vendor, run.result()):
+                                succeeded = True
+                                break
+            finally:
+                # The losing run is not needed; stop its requests instead of letting them spend quota
+                for _, run in pending:
+                    run.cancel()
+                await asyncio.gather(*(run for _, run in pending), return_exceptions=True)
+
+        if succeeded:
+            print(f"DEBUG: Stopping after successful vendor (single-vendor config)")
+            remaining_vendors = []
+
+    for vendor in remaining_vendors:
+        if record(vendor, await start(vendor)):
+            # Stopping logic: Stop after first successful vendor for single-vendor configs
+            if len(primary_vendors) == 1:
+                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
+                break
+
+    return _combine_results(method, results, vendor_attempt_count)
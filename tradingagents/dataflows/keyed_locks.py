@@ -0,0 +1,37 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Hashable, List
+
+
+class KeyedLocks:
+    """One lock per key, kept only while some thread holds or waits on it.
+
+    Each entry counts the threads using it and is dropped when the last one
+    releases, so the registry is as large as the set of keys in use rather
+    than every key ever seen, and unrelated keys never share a lock.
+    """
+
+    def __init__(self):
+        # key -> [lock, threads holding or waiting]
+        self._entries: Dict[Hashable, List] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def hold(self, key: Hashable):
+        with self._guard:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._guard:
+            return len(self._entries)
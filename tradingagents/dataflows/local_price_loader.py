@@ -0,0 +1,117 @@
+import os
+import re
+import glob
+import threading
+from collections import OrderedDict
+from typing import Annotated, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+_FILE_PATTERN = re.compile(r"-YFin-data-(\d{4}-\d{2}-\d{2})-(\d{4}-\d{2}-\d{2})\.csv$")
+
+# path -> (mtime, frame, DatetimeIndex of the frame's dates)
+_frames: "OrderedDict[str, Tuple[float, pd.DataFrame, pd.DatetimeIndex]]" = OrderedDict()
+_frames_guard = threading.Lock()
+
+
+def discover_price_files(
+    directory: Annotated[str, "Directory holding {symbol}-YFin-data-{start}-{end}.csv files"],
+    symbol: Annotated[str, "ticker symbol of the company"],
+) -> List[Tuple[str, str, str]]:
+    """Return (start, end, path) for every price file of symbol in directory, oldest start first."""
+    files = []
+    for path in glob.glob(os.path.join(directory, f"{glob.escape(symbol)}-YFin-data-*.csv")):
+        match = _FILE_PATTERN.search(os.path.basename(path))
+        if match and os.path.basename(path) == f"{symbol}{match.group(0)}":
+            files.append((match.group(1), match.group(2), path))
+    return sorted(files)
+
+
+def find_price_file(
+    directory: Annotated[str, "Directory holding {symbol}-YFin-data-{start}-{end}.csv files"],
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[Optional[str], "First date needed, yyyy-mm-dd"] = None,
+    end_date: Annotated[Optional[str], "Last date needed, yyyy-mm-dd"] = None,
+) -> Tuple[str, str, str]:
+    """
+    Pick the price file to read for a date range.
+
+    With both dates, prefers the narrowest file covering [start_date,
+    end_date]. Without a start date (callers needing all history up to
+    end_date, e.g. indicators), prefers the widest file reaching end_date.
+    If no file covers the range, or no range is given, falls back to the file
+    reaching furthest into the future, widest first.
+
+    Returns:
+        (start, end, path) of the chosen file
+    Raises:
+        FileNotFoundError: If there is no price file for symbol
+    """
+    files = discover_price_files(directory, symbol)
+    if not files:
+        raise FileNotFoundError(f"No YFin price data for {symbol} in {directory}")
+
+    def span(f):
+        return pd.Timestamp(f[1]) - pd.Timestamp(f[0])
+
+    latest = max(files, key=lambda f: (f[1], span(f)))
+    if start_date is None and end_date is None:
+        return latest
+
+    covering = [
+        (start, end, path) for start, end, path in files
+        if (start_date is None or start <= start_date) and (end_date is None or end_date <= end)
+    ]
+    if not covering:
+        return latest
+    if start_date is None:
+        return max(covering, key=lambda f: (span(f), f[1]))
+    return min(covering, key=lambda f: (span(f), f[2]))
+
+
+def _load(path: str) -> Tuple[pd.DataFrame, pd.DatetimeIndex]:
+    mtime = os.path.getmtime(path)
+    with _frames_guard:
+        cached = _frames.get(path)
+        if cached is not None and cached[0] == mtime:
+            _frames.move_to_end(path)
+            return cached[1], cached[2]
+
+    data = pd.read_csv(path)
+    dates = pd.DatetimeIndex(pd.to_datetime(data["Date"].astype(str).str[:10]))
+    if not dates.is_monotonic_increasing:
+        order = dates.argsort(kind="stable")
+        data, dates = data.iloc[order], dates[order]
+
+    max_files = get_config().get("local_price_cache_size", 32)
+    with _frames_guard:
+        _frames[path] = (mtime, data, dates)
+        _frames.move_to_end(path)
+        while len(_frames) > max_files:
+            _frames.popitem(last=False)
+    return data, dates
+
+
+def load_price_csv(path: Annotated[str, "Path of a YFin price CSV"]) -> pd.DataFrame:
+    """
+    Return the parsed contents of a price CSV, read once per process.
+
+    Frames are kept in a bounded LRU (local_price_cache_size files) and
+    re-read when the file's mtime changes. The returned frame is shared;
+    copy it before modifying it.
+    """
+    return _load(path)[0]
+
+
+def get_price_range(
+    path: Annotated[str, "Path of a YFin price CSV"],
+    start_date: Annotated[str, "Start date in yyyy-mm-dd format (inclusive)"],
+    end_date: Annotated[str, "End date in yyyy-mm-dd format (inclusive)"],
+) -> pd.DataFrame:
+    """Rows of a price CSV dated within [start_date, end_date], with their original row labels."""
+    data, dates = _load(path)
+    lo = dates.searchsorted(pd.Timestamp(start_date), side="left")
+    hi = dates.searchsorted(pd.Timestamp(end_date), side="right")
+    return data.iloc[lo:hi]
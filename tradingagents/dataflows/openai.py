@@ -1,12 +1,11 @@
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DEFAULT_TIMEOUT
 from .config import get_config
+from .async_http import get_async_client
 
 
-def get_stock_news_openai(query, start_date, end_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
-
-    response = client.responses.create(
+def _web_search_request(config, prompt):
+    """Keyword arguments of a responses.create call running one web search prompt."""
+    return dict(
         model=config["quick_think_llm"],
         input=[
             {
@@ -14,7 +13,7 @@ def get_stock_news_openai(query, start_date, end_date):
                 "content": [
                     {
                         "type": "input_text",
-                        "text": f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period.",
+                        "text": prompt,
                     }
                 ],
             }
@@ -34,6 +33,8 @@ def get_stock_news_openai(query, start_date, end_date):
         store=True,
     )
 
+
+def _response_text(response):
     # Safely access response output
     if not response.output or len(response.output) < 2:
         raise ValueError("OpenAI response output is empty or insufficient")
@@ -43,83 +44,52 @@ def get_stock_news_openai(query, start_date, end_date):
     return response.output[1].content[0].text
 
 
-def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+def _web_search(prompt):
     config = get_config()
     client = OpenAI(base_url=config["backend_url"])
+    response = client.responses.create(**_web_search_request(config, prompt))
+    return _response_text(response)
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles.",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
 
-    # Safely access response output
-    if not response.output or len(response.output) < 2:
-        raise ValueError("OpenAI response output is empty or insufficient")
-    if not response.output[1].content or len(response.output[1].content) < 1:
-        raise ValueError("OpenAI response content is empty")
+async def _aweb_search(prompt):
+    config = get_config()
+    client = AsyncOpenAI(base_url=config["backend_url"], http_client=get_async_client())
+    # The shared client's timeout is sized for data APIs; web searches get the SDK default, as on the sync path
+    response = await client.responses.create(**_web_search_request(config, prompt), timeout=DEFAULT_TIMEOUT)
+    return _response_text(response)
+
+
+def _stock_news_prompt(query, start_date, end_date):
+    return f"Can you search Social Media for {query} from {start_date} to {end_date}? Make sure you only get the data posted during that period."
+
+
+def _global_news_prompt(curr_date, look_back_days, limit):
+    return f"Can you search global or macroeconomics news from {look_back_days} days before {curr_date} to {curr_date} that would be informative for trading purposes? Make sure you only get the data posted during that period. Limit the results to {limit} articles."
 
-    return response.output[1].content[0].text
+
+def _fundamentals_prompt(ticker, curr_date):
+    return f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc"
+
+
+def get_stock_news_openai(query, start_date, end_date):
+    return _web_search(_stock_news_prompt(query, start_date, end_date))
+
+
+def get_global_news_openai(curr_date, look_back_days=7, limit=5):
+    return _web_search(_global_news_prompt(curr_date, look_back_days, limit))
 
 
 def get_fundamentals_openai(ticker, curr_date):
-    config = get_config()
-    client = OpenAI(base_url=config["backend_url"])
+    return _web_search(_fundamentals_prompt(ticker, curr_date))
 
-    response = client.responses.create(
-        model=config["quick_think_llm"],
-        input=[
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": f"Can you search Fundamental for discussions on {ticker} during of the month before {curr_date} to the month of {curr_date}. Make sure you only get the data posted during that period. List as a table, with PE/PS/Cash flow/ etc",
-                    }
-                ],
-            }
-        ],
-        text={"format": {"type": "text"}},
-        reasoning={},
-        tools=[
-            {
-                "type": "web_search_preview",
-                "user_location": {"type": "approximate"},
-                "search_context_size": "low",
-            }
-        ],
-        temperature=1,
-        max_output_tokens=4096,
-        top_p=1,
-        store=True,
-    )
 
-    # Safely access response output
-    if not response.output or len(response.output) < 2:
-        raise ValueError("OpenAI response output is empty or insufficient")
-    if not response.output[1].content or len(response.output[1].content) < 1:
-        raise ValueError("OpenAI response content is empty")
+async def aget_stock_news_openai(query, start_date, end_date):
+    return await _aweb_search(_stock_news_prompt(query, start_date, end_date))
+
+
+async def aget_global_news_openai(curr_date, look_back_days=7, limit=5):
+    return await _aweb_search(_global_news_prompt(curr_date, look_back_days, limit))
+
 
-    return response.output[1].content[0].text
\ No newline at end of file
+async def aget_fundamentals_openai(ticker, curr_date):
+    return await _aweb_search(_fundamentals_prompt(ticker, curr_date))
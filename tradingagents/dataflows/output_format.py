@@ -0,0 +1,81 @@
+import threading
+from typing import Annotated, Dict
+
+import pandas as pd
+
+from .config import get_config
+
+# Price columns that add nothing when they carry no information
+_EVENT_COLUMNS = ["Dividends", "Stock Splits", "Capital Gains"]
+
+# Rough characters per token for English text and CSV; good enough for reporting
+CHARS_PER_TOKEN = 4
+
+_savings = {"calls": 0, "bytes_saved": 0, "tokens_saved": 0}
+_savings_guard = threading.Lock()
+
+
+def is_compact_output() -> bool:
+    """Whether tool results should be rendered in the compact format (tool_output_format)."""
+    return get_config().get("tool_output_format", "full") == "compact"
+
+
+def float_format() -> str:
+    """printf-style format giving every float compact_significant_digits significant digits."""
+    return f"%.{get_config().get('compact_significant_digits', 5)}g"
+
+
+def format_value(value) -> str:
+    if pd.isna(value):
+        return "N/A"
+    if isinstance(value, float):
+        return float_format() % value
+    return str(value)
+
+
+def compact_price_frame(data: Annotated[pd.DataFrame, "OHLCV bars indexed by date"]) -> pd.DataFrame:
+    """Drop columns that repeat others or are empty: all-zero event columns, Adj Close equal to Close."""
+    drop = [col for col in _EVENT_COLUMNS if col in data.columns and not data[col].fillna(0).any()]
+    if "Adj Close" in data.columns and "Close" in data.columns and data["Adj Close"].equals(data["Close"]):
+        drop.append("Adj Close")
+    data = data.drop(columns=drop)
+
+    if "Volume" in data.columns and data["Volume"].notna().all() and (data["Volume"] % 1 == 0).all():
+        data = data.astype({"Volume": "int64"})
+    if isinstance(data.index, pd.DatetimeIndex):
+        data.index = data.index.strftime("%Y-%m-%d")
+        data.index.name = "Date"
+    return data
+
+
+def report_savings(
+    name: Annotated[str, "Tool or function the output belongs to"],
+    full_output: Annotated[str, "The output as the full format renders it"],
+    compact_output: Annotated[str, "The output actually returned"],
+) -> Dict[str, int]:
+    """Add how much the compact rendering saved for one call to the process totals.
+
+    Each call is also logged when compact_savings_log is on.
+    """
+    full_bytes = len(full_output.encode("utf-8"))
+    compact_bytes = len(compact_output.encode("utf-8"))
+    saved = {
+        "bytes_saved": full_bytes - compact_bytes,
+        "tokens_saved": (full_bytes - compact_bytes) // CHARS_PER_TOKEN,
+    }
+    with _savings_guard:
+        _savings["calls"] += 1
+        _savings["bytes_saved"] += saved["bytes_saved"]
+        _savings["tokens_saved"] += saved["tokens_saved"]
+    if get_config().get("compact_savings_log", False):
+        print(
+            f"COMPACT: {name} output {compact_bytes} bytes instead of {full_bytes} "
+            f"(saved {saved['bytes_saved']} bytes, ~{saved['tokens_saved']} tokens)"
+        )
+    return saved
+
+
+def get_output_savings() -> Dict[str, int]:
+    """Totals of report_savings since the process started."""
+    with _savings_guard:
+        return dict(_savings)
@@ -0,0 +1,174 @@
+import os
+import glob
+import threading
+from typing import Annotated, Optional
+
+import pandas as pd
+
+from .config import get_config
+from .yfin_pool import get_ticker
+
+# How much daily history a freshly created store covers
+HISTORY_YEARS = 15
+
+# Relative tolerance when comparing the overlapping bar of an incremental fetch.
+# A larger drift means Yahoo re-adjusted the history (split/dividend).
+ADJUSTMENT_TOLERANCE = 1e-4
+
+# Name of the pre-fetched file used by the "local" vendor; never pruned
+LOCAL_FIXTURE_RANGE = "2015-01-01-2025-03-25"
+
+_symbol_locks = {}
+_symbol_locks_guard = threading.Lock()
+
+
+def _get_symbol_lock(symbol: str) -> threading.Lock:
+    with _symbol_locks_guard:
+        if symbol not in _symbol_locks:
+            _symbol_locks[symbol] = threading.Lock()
+        return _symbol_locks[symbol]
+
+
+def _store_dir() -> str:
+    config = get_config()
+    return os.path.join(config["data_cache_dir"], "price_store")
+
+
+def _store_path(symbol: str) -> str:
+    return os.path.join(_store_dir(), f"{symbol}.parquet")
+
+
+def _history_floor() -> pd.Timestamp:
+    """First date a newly created store covers."""
+    return pd.Timestamp.today().normalize() - pd.DateOffset(years=HISTORY_YEARS)
+
+
+def _download_bars(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Fetch adjusted daily bars in [start, end) from Yahoo Finance."""
+    data = get_ticker(symbol).history(
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        auto_adjust=True,
+        actions=True,
+    )
+    if data.empty:
+        return pd.DataFrame()
+
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index = data.index.normalize()
+    data.index.name = "Date"
+
+    return data.reset_index()
+
+
+def _write_store(path: str, data: pd.DataFrame) -> None:
+    """Atomically replace the store file so concurrent readers never see a partial write."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    data.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _prune_legacy_csv_cache(symbol: str) -> None:
+    """Remove date-stamped CSV caches written before the price store existed."""
+    cache_dir = get_config()["data_cache_dir"]
+    for legacy_file in glob.glob(os.path.join(cache_dir, f"{symbol}-YFin-data-*.csv")):
+        if os.path.basename(legacy_file) == f"{symbol}-YFin-data-{LOCAL_FIXTURE_RANGE}.csv":
+            continue
+        try:
+            os.remove(legacy_file)
+        except OSError:
+            pass
+
+
+def _sync_symbol(symbol: str) -> Optional[pd.DataFrame]:
+    """Bring the stored history for symbol up to the last completed trading day.
+
+    Only bars after the last stored date are downloaded. The last stored bar is
+    re-fetched as well; if its adjusted close moved, the whole history is
+    rebuilt since Yahoo has re-adjusted it for a split or dividend.
+    """
+    path = _store_path(symbol)
+    # Today's bar is still forming, so the store only ever holds completed sessions
+    today = pd.Timestamp.today().normalize()
+
+    stored = pd.read_parquet(path) if os.path.exists(path) else None
+
+    if stored is not None and not stored.empty:
+        # The store is checked at most once per day
+        checked_on = pd.Timestamp.fromtimestamp(os.path.getmtime(path)).normalize()
+        if checked_on >= today:
+            return stored
+
+        last_date = stored["Date"].iloc[-1]
+        new_bars = _download_bars(symbol, last_date, today)
+
+        if new_bars.empty:
+            os.utime(path)
+            return stored
+
+        overlap = new_bars[new_bars["Date"] == last_date]
+        if not overlap.empty:
+            old_close = stored["Close"].iloc[-1]
+            new_close = overlap["Close"].iloc[0]
+            if abs(new_close - old_close) > ADJUSTMENT_TOLERANCE * max(abs(old_close), 1.0):
+                stored = None
+
+        if stored is not None:
+            new_bars = new_bars[new_bars["Date"] > last_date]
+            if new_bars.empty:
+                os.utime(path)
+                return stored
+            data = pd.concat([stored, new_bars], ignore_index=True)
+            _write_store(path, data)
+            return data
+
+    data = _download_bars(symbol, _history_floor(), today)
+    if data.empty:
+        return None
+
+    _write_store(path, data)
+    _prune_legacy_csv_cache(symbol)
+    return data
+
+
+def load_price_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    start_date: Annotated[Optional[str], "Start date in yyyy-mm-dd format (inclusive)"] = None,
+    end_date: Annotated[Optional[str], "End date in yyyy-mm-dd format (exclusive)"] = None,
+) -> pd.DataFrame:
+    """
+    Return adjusted daily OHLCV bars for a symbol from the local price store.
+
+    The store keeps one Parquet file per symbol under data_cache_dir/price_store
+    and appends only the bars that are missing since the last sync. Dates come
+    back as a typed "Date" column (datetime64) alongside the price columns.
+
+    Args:
+        symbol: Ticker symbol of the company
+        start_date: Optional inclusive lower bound
+        end_date: Optional exclusive upper bound, matching yfinance semantics
+    Returns:
+        pd.DataFrame: Bars sorted by date, empty if Yahoo returns nothing
+    """
+    symbol = symbol.upper()
+
+    with _get_symbol_lock(symbol):
+        data = _sync_symbol(symbol)
+
+    if data is None or data.empty:
+        return pd.DataFrame()
+
+    mask = pd.Series(True, index=data.index)
+    if start_date is not None:
+        mask &= data["Date"] >= pd.Timestamp(start_date)
+    if end_date is not None:
+        mask &= data["Date"] < pd.Timestamp(end_date)
+
+    return data.loc[mask].reset_index(drop=True)
+
+
+def covers_start_date(start_date: Annotated[str, "Start date in yyyy-mm-dd format"]) -> bool:
+    """Whether the store's history window reaches back to start_date."""
+    return pd.Timestamp(start_date) >= _history_floor()
@@ -1,12 +1,17 @@
 import requests
 import time
 import json
+import heapq
+import threading
 from datetime import datetime, timedelta
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Annotated
 import os
 import re
 
+from .config import get_config
+
 ticker_to_company = {
     "AAPL": "Apple",
     "MSFT": "Microsoft",
@@ -49,87 +54,190 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+# Per-file date indexes live under data_path in this directory, keyed by category
+INDEX_DIR = ".date_index"
+
+_indexes = {}
+_indexes_guard = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_company_matcher(query: str) -> re.Pattern:
+    """One compiled, case-insensitive alternation of the company's aliases and its ticker.
+
+    Aliases are combined as-is, so a post matches exactly when one of the
+    per-alias searches used to match.
+    """
+    search_terms = ticker_to_company[query].split(" OR ") + [query]
+    return re.compile("|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE)
+
+
+def _mentions_company(parsed_line: dict, query: str) -> bool:
+    """Check that the title or the content has the company's name (query) mentioned."""
+    matcher = get_company_matcher(query)
+    return bool(matcher.search(parsed_line["title"]) or matcher.search(parsed_line["selftext"]))
+
+
+def _post_date(parsed_line: dict) -> str:
+    return datetime.utcfromtimestamp(parsed_line["created_utc"]).strftime("%Y-%m-%d")
+
+
+def _build_date_index(file_path: str, with_mentions: bool) -> dict:
+    """Map each post date to the byte offsets of its lines in a .jsonl file.
+
+    With with_mentions, also map every ticker in ticker_to_company to the
+    offsets of the posts that mention it.
+    """
+    dates = {}
+    mentions = {ticker: [] for ticker in ticker_to_company} if with_mentions else None
+    with open(file_path, "rb") as f:
+        offset = 0
+        for line in f:
+            if line.strip():
+                parsed_line = json.loads(line)
+                dates.setdefault(_post_date(parsed_line), []).append(offset)
+                if with_mentions:
+                    for ticker, ticker_offsets in mentions.items():
+                        if _mentions_company(parsed_line, ticker):
+                            ticker_offsets.append(offset)
+            offset += len(line)
+    return {"dates": dates, "mentions": mentions}
+
+
+def load_date_index(base_path: str, category: str, data_file: str) -> dict:
+    """Return the index for one subreddit file, building it on first use.
+
+    The index holds "dates" (date -> line offsets) and, for company categories
+    when reddit_mention_index is enabled, "mentions" (ticker -> offsets of
+    posts mentioning the company). It is kept next to the data (under
+    INDEX_DIR) and rebuilt when the .jsonl file's size or mtime, or the set of
+    known tickers, changes. If the data folder is read-only the index is only
+    kept in memory.
+    """
+    file_path = os.path.join(base_path, category, data_file)
+    stat = os.stat(file_path)
+    with_mentions = "company" in category and get_config().get("reddit_mention_index", True)
+    signature = [stat.st_size, stat.st_mtime, sorted(ticker_to_company) if with_mentions else None]
+
+    with _indexes_guard:
+        cached = _indexes.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index_path = os.path.join(base_path, INDEX_DIR, category, f"{data_file}.json")
+        index = None
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                stored = json.load(f)
+            if stored.get("signature") == signature:
+                index = {"dates": stored["dates"], "mentions": stored.get("mentions")}
+
+        if index is None:
+            index = _build_date_index(file_path, with_mentions)
+            try:
+                os.makedirs(os.path.dirname(index_path), exist_ok=True)
+                with open(index_path, "w") as f:
+                    json.dump({"signature": signature, **index}, f)
+            except OSError:
+                pass
+
+        if index["mentions"] is not None:
+            index["mentions"] = {ticker: set(offsets) for ticker, offsets in index["mentions"].items()}
+
+        _indexes[file_path] = (signature, index)
+        return index
+
+
+def fetch_top_from_category_range(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd (inclusive)."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
-    base_path = data_path
+    """Top posts per day and subreddit over a date range, read through the date index.
 
-    all_content = []
+    Results are grouped by day (ascending), then by subreddit file, exactly as
+    calling fetch_top_from_category once per day would return them, but each
+    file is opened once and only the lines dated within the range are parsed.
+    """
+    base_path = data_path
+    data_files = os.listdir(os.path.join(base_path, category))
 
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(data_files):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(data_files)
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
+    dates = []
+    curr_date = datetime.strptime(start_date, "%Y-%m-%d")
+    while curr_date <= datetime.strptime(end_date, "%Y-%m-%d"):
+        dates.append(curr_date.strftime("%Y-%m-%d"))
+        curr_date += timedelta(days=1)
+
+    content_by_date = {date: [] for date in dates}
+
+    for data_file in data_files:
         # check if data_file is a .jsonl file
         if not data_file.endswith(".jsonl"):
             continue
 
-        all_content_curr_subreddit = []
+        index = load_date_index(base_path, category, data_file)
+        filter_company = "company" in category and query
+        # Posts mentioning the company, straight from the index when it has them
+        mentioned = index["mentions"].get(query) if filter_company and index["mentions"] else None
 
         with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
+            for date in dates:
+                candidates = []
+                for offset in index["dates"].get(date, []):
+                    if mentioned is not None and offset not in mentioned:
+                        continue
 
-                parsed_line = json.loads(line)
+                    f.seek(offset)
+                    parsed_line = json.loads(f.readline())
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
+                    # if is company_news, check that the title or the content has the company's name (query) mentioned
+                    if filter_company and mentioned is None and not _mentions_company(parsed_line, query):
                         continue
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+                    candidates.append({
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": date,
+                    })
 
-                all_content_curr_subreddit.append(post)
+                # highest upvotes first, ties kept in file order
+                content_by_date[date].extend(
+                    heapq.nlargest(limit_per_subreddit, candidates, key=lambda x: x["upvotes"])
+                )
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    all_content = []
+    for date in dates:
+        all_content.extend(content_by_date[date])
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(category, date, date, max_limit, query, data_path)
@@ -0,0 +1,136 @@
+import os
+import threading
+from typing import Annotated, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .config import get_config
+
+# statement -> (directory under simfin_data_all, file name prefix)
+STATEMENT_FILES = {
+    "balance_sheet": ("balance_sheet", "us-balance"),
+    "cash_flow": ("cash_flow", "us-cashflow"),
+    "income_statements": ("income_statements", "us-income"),
+}
+
+_views = {}
+_views_guard = threading.Lock()
+
+
+def _source_path(statement: str, freq: str) -> str:
+    directory, prefix = STATEMENT_FILES[statement]
+    return os.path.join(
+        get_config()["data_dir"],
+        "fundamental_data",
+        "simfin_data_all",
+        directory,
+        "companies",
+        "us",
+        f"{prefix}-{freq}.csv",
+    )
+
+
+def _store_path(statement: str, freq: str) -> str:
+    _, prefix = STATEMENT_FILES[statement]
+    return os.path.join(get_config()["data_cache_dir"], "simfin_store", f"{prefix}-{freq}.arrow")
+
+
+def convert_statement_file(source_path: str, store_path: str) -> None:
+    """One-time conversion of a SimFin CSV into an Arrow file sorted by (Ticker, Publish Date).
+
+    Dates are parsed here once, the same way the lookups used to on every call.
+    The sort is stable, so statements sharing a publish date keep file order.
+    """
+    df = pd.read_csv(source_path, sep=";")
+
+    # Convert date strings to datetime objects and remove any time components
+    df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+    df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+    # The original row number is kept as the index; it names the returned Series
+    df = df.sort_values(["Ticker", "Publish Date"], kind="stable")
+
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    tmp_path = f"{store_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, store_path)
+
+
+class SimFinStatementView:
+    """Memory-mapped, read-only view of one converted SimFin statement file.
+
+    Only the Ticker and Publish Date columns are materialized; a lookup slices
+    the ticker's contiguous block, binary-searches the publish dates and
+    converts the single matching row.
+    """
+
+    def __init__(self, store_path: str):
+        self.table = pa.ipc.open_file(pa.memory_map(store_path, "r")).read_all()
+
+        tickers = self.table.column("Ticker").to_pandas()
+        self.publish_dates = (
+            self.table.column("Publish Date").to_pandas().to_numpy(dtype="datetime64[ns]")
+        )
+        self.offsets: Dict[str, Tuple[int, int]] = {
+            ticker: (int(rows[0]), int(rows[-1]) + 1)
+            for ticker, rows in tickers.groupby(tickers, sort=False).indices.items()
+        }
+
+    def as_of(self, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """Latest statement for ticker published on or before curr_date, or None."""
+        bounds = self.offsets.get(ticker)
+        if bounds is None:
+            return None
+        start, end = bounds
+
+        curr_date_dt = np.datetime64(pd.Timestamp(curr_date).normalize().to_datetime64(), "ns")
+        published = self.publish_dates[start:end]
+        pos = int(np.searchsorted(published, curr_date_dt, side="right"))
+        if pos == 0:
+            return None
+
+        # First statement carrying the latest publish date, matching idxmax
+        pos = int(np.searchsorted(published, published[pos - 1], side="left"))
+        return self.table.slice(start + pos, 1).to_pandas(use_threads=False).iloc[0]
+
+
+def _get_view(statement: str, freq: str) -> SimFinStatementView:
+    source_path = _source_path(statement, freq)
+    store_path = _store_path(statement, freq)
+
+    with _views_guard:
+        stale = not os.path.exists(store_path) or (
+            os.path.getmtime(store_path) < os.path.getmtime(source_path)
+        )
+        if stale:
+            print(f"INFO: Converting SimFin {statement} ({freq}) into an indexed store, this is done once")
+            convert_statement_file(source_path, store_path)
+            _views.pop(store_path, None)
+        if store_path not in _views:
+            _views[store_path] = SimFinStatementView(store_path)
+        return _views[store_path]
+
+
+def get_latest_statement(
+    statement: Annotated[str, "balance_sheet, cash_flow or income_statements"],
+    freq: Annotated[str, "reporting frequency of the company's financial history: annual / quarterly"],
+    ticker: Annotated[str, "ticker symbol"],
+    curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+) -> Optional[pd.Series]:
+    """
+    Return the latest SimFin statement for a ticker published on or before curr_date.
+
+    The US-wide SimFin CSV is converted on first use into an Arrow file under
+    data_cache_dir/simfin_store, sorted by (Ticker, Publish Date), and is
+    re-converted whenever the source CSV is newer. The converted file is
+    memory-mapped once per process and shared across threads.
+
+    Returns:
+        pd.Series: The statement row (including SimFinId), or None if nothing was published yet
+    """
+    return _get_view(statement, freq).as_of(ticker, curr_date)
@@ -1,9 +1,10 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config, DATA_DIR
+from .price_store import load_price_history
+from .local_price_loader import find_price_file, load_price_csv
 
 
 class StockstatsUtils:
@@ -26,47 +27,18 @@ class StockstatsUtils:
 
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        DATA_DIR,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
+                _, _, data_path = find_price_file(DATA_DIR, symbol, end_date=curr_date)
+                data = load_price_csv(data_path).copy()
                 df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
             curr_date = pd.to_datetime(curr_date)
 
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
+            # Online data comes from the shared incremental price store
+            data = load_price_history(symbol)
+            if data.empty:
+                raise Exception(f"Stockstats fail: no price data returned for {symbol}")
 
             df = wrap(data)
             df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
@@ -37,3 +37,17 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+def parse_indicator_list(indicators):
+    """Normalize an indicator argument (name, comma-separated names or list) to a list of names."""
+    if isinstance(indicators, str):
+        indicators = indicators.split(",")
+    parsed = []
+    for name in indicators:
+        name = name.strip()
+        if name and name not in parsed:
+            parsed.append(name)
+    if not parsed:
+        raise ValueError("No indicator specified")
+    return parsed
@@ -0,0 +1,188 @@
+import os
+import re
+import json
+import time
+import pickle
+import sqlite3
+import inspect
+import threading
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from .config import get_config
+from .output_format import is_compact_output
+
+# Default time-to-live per TOOLS_CATEGORIES entry, in seconds
+DEFAULT_CATEGORY_TTLS = {
+    "core_stock_apis": 60 * 60,
+    "technical_indicators": 60 * 60,
+    "fundamental_data": 3 * 24 * 60 * 60,
+    "news_data": 6 * 60 * 60,
+}
+
+# Categories whose results never change once every requested date is in the past
+HISTORICAL_CATEGORIES = {"core_stock_apis", "technical_indicators"}
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_SYMBOL_PARAMS = {"symbol", "ticker"}
+
+# Sentinel so that a cached None is distinguishable from a miss
+MISS = object()
+
+
+class VendorResponseCache:
+    """SQLite-backed cache of vendor responses shared across runs and processes.
+
+    Rows are keyed on (method, vendor, implementation, normalized arguments) and
+    carry an expiry time derived from the method's category TTL. Results for
+    price and indicator queries that end before today never expire.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS vendor_responses (
+                cache_key TEXT PRIMARY KEY,
+                method TEXT NOT NULL,
+                vendor TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                payload BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "DELETE FROM vendor_responses WHERE expires_at IS NOT NULL AND expires_at < ?",
+            (time.time(),),
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(method: str, vendor: str, impl_func: Callable, args: tuple, kwargs: dict) -> Tuple[str, dict]:
+        """Build a stable key from the call, binding positional args to parameter names."""
+        try:
+            bound = inspect.signature(impl_func).bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = dict(bound.arguments)
+        except TypeError:
+            call_args = {"args": list(args), **kwargs}
+
+        normalized = {}
+        for name, value in call_args.items():
+            if isinstance(value, str):
+                value = value.strip()
+                if name in _SYMBOL_PARAMS:
+                    value = value.upper()
+            normalized[name] = value
+
+        parts = [method, vendor, impl_func.__name__, normalized]
+        if is_compact_output():
+            # Compact renderings are cached apart from the full ones
+            parts.append("compact")
+        key = json.dumps(parts, sort_keys=True, default=str)
+        return key, normalized
+
+    @staticmethod
+    def ttl_for(category: str, normalized_args: dict) -> Optional[float]:
+        """Seconds until a response expires, or None if it never does."""
+        if category in HISTORICAL_CATEGORIES:
+            dates = [
+                value for value in normalized_args.values()
+                if isinstance(value, str) and _DATE_PATTERN.match(value)
+            ]
+            if dates and max(dates) < datetime.now().strftime("%Y-%m-%d"):
+                return None
+
+        ttls = get_config().get("vendor_cache_ttls") or {}
+        return ttls.get(category, DEFAULT_CATEGORY_TTLS.get(category, 0))
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, payload FROM vendor_responses WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return MISS
+
+            expires_at, payload = row
+            if expires_at is not None and expires_at < time.time():
+                self._conn.execute("DELETE FROM vendor_responses WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return MISS
+
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key: str, method: str, vendor: str, result: Any, ttl: Optional[float]) -> None:
+        if ttl is not None and ttl <= 0:
+            return
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO vendor_responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method, vendor, now, expires_at, payload),
+            )
+            self._conn.commit()
+
+    def clear(self, method: Optional[str] = None) -> None:
+        with self._lock:
+            if method:
+                self._conn.execute("DELETE FROM vendor_responses WHERE method = ?", (method,))
+            else:
+                self._conn.execute("DELETE FROM vendor_responses")
+            self._conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM vendor_responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """Skip empty results and the error strings some vendors return instead of raising."""
+    if result is None:
+        return False
+    if isinstance(result, str):
+        first_line = result.strip().split("\n", 1)[0].lower()
+        if not first_line or first_line.startswith("error"):
+            return False
+        return not (first_line.startswith("no ") and " found" in first_line)
+    if hasattr(result, "empty"):
+        return not result.empty
+    return True
+
+
+_caches = {}
+_caches_guard = threading.Lock()
+
+
+def get_vendor_cache() -> Optional[VendorResponseCache]:
+    """Return the cache for the configured data_cache_dir, or None when caching is disabled."""
+    config = get_config()
+    if not config.get("vendor_cache_enabled", True):
+        return None
+
+    db_path = os.path.join(config["data_cache_dir"], "vendor_cache.sqlite")
+    with _caches_guard:
+        if db_path not in _caches:
+            _caches[db_path] = VendorResponseCache(db_path)
+        return _caches[db_path]
@@ -0,0 +1,284 @@
+import time
+import asyncio
+import threading
+import concurrent.futures
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import openai
+import requests
+
+from .config import get_config
+from .alpha_vantage_common import AlphaVantageRateLimitError
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # older yfinance
+    YFRateLimitError = None
+
+try:
+    from curl_cffi.requests.exceptions import RequestException as CurlRequestException
+except ImportError:  # yfinance before curl_cffi
+    CurlRequestException = None
+
+# Errors that mean the vendor could not be reached or did not answer in time
+_TRANSPORT_ERRORS = tuple(
+    error for error in (
+        ConnectionError,
+        TimeoutError,
+        asyncio.TimeoutError,
+        concurrent.futures.TimeoutError,
+        requests.ConnectionError,
+        requests.Timeout,
+        httpx.TransportError,
+        openai.APIConnectionError,
+        CurlRequestException,
+    )
+    if error is not None
+)
+_RATE_LIMIT_ERRORS = tuple(
+    error for error in (AlphaVantageRateLimitError, openai.RateLimitError, YFRateLimitError)
+    if error is not None
+)
+
+
+def classify_failure(error: BaseException) -> Optional[str]:
+    """How a vendor call's error counts on the scoreboard.
+
+    "rate_limit" or "fault" (transport errors, timeouts and 5xx answers) are
+    held against the vendor. None means the call itself was at fault (bad
+    arguments, unknown symbol, a 4xx answer) and says nothing about the
+    vendor's health.
+    """
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        return "rate_limit"
+
+    status = getattr(error, "status_code", None)
+    if status is None:
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        if status == 429:
+            return "rate_limit"
+        if status >= 500:
+            return "fault"
+
+    if isinstance(error, _TRANSPORT_ERRORS):
+        return "fault"
+    return None
+
+# Smoothing factor for the success-rate and latency moving averages
+EWMA_ALPHA = 0.3
+
+
+class _HealthRecord:
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.rate_limits = 0
+        self.consecutive_failures = 0
+        self.success_rate = 1.0
+        self.latency = None
+        self.open_until = 0.0
+        self.last_error = None
+        self.last_called = None
+
+
+class CircuitOpenError(Exception):
+    """A vendor call was refused because the vendor's circuit is open or its trial call is in flight."""
+
+
+class VendorHealthTracker:
+    """Thread-safe scoreboard of vendor outcomes used by route_to_vendor.
+
+    Outcomes are tracked per (vendor, method). Consecutive failures open a
+    circuit for that pair, and a rate-limit error opens it for every method of
+    the vendor, since the limit belongs to the API key. While a circuit is
+    open the vendor is skipped. Once the cool-down passes the circuit is
+    half-open: exactly one caller claims a trial call (admit) and everyone else
+    keeps skipping the vendor until that call is recorded. A successful trial
+    closes the circuit; a failed one re-opens it for another cool-down.
+    """
+
+    def __init__(self):
+        self._records: Dict[Tuple[str, str], _HealthRecord] = {}
+        self._vendor_open_until: Dict[str, float] = {}
+        # (vendor, method), or (vendor, None) for the vendor-wide circuit -> when its trial call was claimed
+        self._trials: Dict[Tuple[str, Optional[str]], float] = {}
+        self._lock = threading.Lock()
+
+    def _circuit_state(self, key: Tuple[str, Optional[str]], open_until: float, now: float) -> str:
+        """"closed", "open" (cooling down or trial in flight) or "half_open" (a trial may be claimed)."""
+        if not open_until:
+            return "closed"
+        if open_until > now:
+            return "open"
+        claimed = self._trials.get(key)
+        # A trial whose outcome never arrived (e.g. a hung call) expires after a failure cool-down
+        if claimed is not None and claimed + get_config().get("vendor_failure_cooldown", 5 * 60) > now:
+            return "open"
+        return "half_open"
+
+    def _circuits(self, vendor: str, method: str, now: float) -> List[Tuple[Tuple[str, Optional[str]], str]]:
+        record = self._records.get((vendor, method))
+        return [
+            ((vendor, None), self._circuit_state((vendor, None), self._vendor_open_until.get(vendor, 0.0), now)),
+            ((vendor, method), self._circuit_state((vendor, method), record.open_until if record else 0.0, now)),
+        ]
+
+    def admit(self, vendor: str, method: str) -> List[Tuple[str, Optional[str]]]:
+        """Let one call to vendor through, claiming the trial of any half-open circuit.
+
+        Returns the trials claimed (empty while circuits are closed). The call's
+        outcome settles them through record_success / record_failure, or
+        end_trial when the outcome says nothing about the vendor. Raises
+        CircuitOpenError when the vendor must be skipped.
+        """
+        if not get_config().get("vendor_circuit_breaker_enabled", True):
+            return []
+        now = time.time()
+        with self._lock:
+            circuits = self._circuits(vendor, method, now)
+            if any(state == "open" for _, state in circuits):
+                raise CircuitOpenError(f"Circuit open for vendor '{vendor}' ({method})")
+            trials = [key for key, state in circuits if state == "half_open"]
+            for key in trials:
+                self._trials[key] = now
+        if trials:
+            print(f"CIRCUIT: Vendor '{vendor}' half-open for {method}, letting one trial call through")
+        return trials
+
+    def end_trial(self, trials: List[Tuple[str, Optional[str]]]) -> None:
+        """Release claimed trials without an outcome, so the next caller may claim them."""
+        with self._lock:
+            for key in trials:
+                self._trials.pop(key, None)
+
+    def _record(self, vendor: str, method: str) -> _HealthRecord:
+        key = (vendor, method)
+        if key not in self._records:
+            self._records[key] = _HealthRecord()
+        return self._records[key]
+
+    def record_success(self, vendor: str, method: str, latency: float) -> None:
+        with self._lock:
+            record = self._record(vendor, method)
+            record.successes += 1
+            record.consecutive_failures = 0
+            record.success_rate = EWMA_ALPHA + (1 - EWMA_ALPHA) * record.success_rate
+            record.latency = latency if record.latency is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * record.latency
+            )
+            record.open_until = 0.0
+            record.last_called = time.time()
+            # Any success settles a trial: the vendor answers again
+            self._vendor_open_until.pop(vendor, None)
+            self._trials.pop((vendor, None), None)
+            self._trials.pop((vendor, method), None)
+
+    def record_failure(self, vendor: str, method: str, error: Exception, rate_limited: bool = False) -> None:
+        config = get_config()
+        now = time.time()
+        with self._lock:
+            record = self._record(vendor, method)
+            record.failures += 1
+            record.consecutive_failures += 1
+            record.success_rate = (1 - EWMA_ALPHA) * record.success_rate
+            record.last_error = str(error)[:200]
+            record.last_called = now
+            vendor_trial = self._trials.pop((vendor, None), None) is not None
+            method_trial = self._trials.pop((vendor, method), None) is not None
+
+            if rate_limited:
+                record.rate_limits += 1
+                cooldown = config.get("vendor_rate_limit_cooldown", 60 * 60)
+                self._vendor_open_until[vendor] = now + cooldown
+                print(f"CIRCUIT: Vendor '{vendor}' rate limited, skipping it for {cooldown}s")
+                return
+            if vendor_trial:
+                # The rate limit has lifted; the failure itself counts per method below
+                self._vendor_open_until.pop(vendor, None)
+            if method_trial or record.consecutive_failures >= config.get("vendor_failure_threshold", 3):
+                cooldown = config.get("vendor_failure_cooldown", 5 * 60)
+                record.open_until = now + cooldown
+                if method_trial:
+                    print(f"CIRCUIT: Trial call to vendor '{vendor}' failed for {method}, skipping it for {cooldown}s")
+                else:
+                    print(f"CIRCUIT: Vendor '{vendor}' failed {record.consecutive_failures} times in a row for {method}, skipping it for {cooldown}s")
+
+    def is_open(self, vendor: str, method: str) -> bool:
+        """Whether calls to vendor are refused right now; a half-open circuit whose trial is unclaimed is not."""
+        now = time.time()
+        with self._lock:
+            return any(state == "open" for _, state in self._circuits(vendor, method, now))
+
+    def rank(self, vendors: List[str], method: str) -> List[str]:
+        """Order vendors by recent success rate, then by average latency. Stable for ties."""
+        with self._lock:
+            def score(vendor):
+                record = self._records.get((vendor, method))
+                if record is None:
+                    return (-1.0, 0.0)
+                return (-record.success_rate, record.latency or 0.0)
+
+            return sorted(vendors, key=score)
+
+    def order_vendors(self, method: str, primary_vendors: List[str], fallback_vendors: List[str]) -> List[str]:
+        """Apply health to a fallback order.
+
+        Primary vendors keep their configured order; the remaining fallbacks are
+        ranked by health. Vendors with an open circuit are dropped, even if that
+        leaves nothing to try, since admit would refuse their calls anyway.
+        """
+        primaries = [v for v in fallback_vendors if v in primary_vendors]
+        others = self.rank([v for v in fallback_vendors if v not in primary_vendors], method)
+        ordered = primaries + others
+
+        healthy = [v for v in ordered if not self.is_open(v, method)]
+        for vendor in ordered:
+            if vendor not in healthy:
+                print(f"CIRCUIT: Skipping vendor '{vendor}' for {method} (circuit open)")
+        return healthy
+
+    def snapshot(self) -> List[dict]:
+        """Per (vendor, method) stats for display, e.g. in the dashboard."""
+        now = time.time()
+        with self._lock:
+            rows = []
+            for (vendor, method), record in sorted(self._records.items()):
+                open_until = max(record.open_until, self._vendor_open_until.get(vendor, 0.0))
+                states = [state for _, state in self._circuits(vendor, method, now)]
+                rows.append({
+                    "vendor": vendor,
+                    "method": method,
+                    "successes": record.successes,
+                    "failures": record.failures,
+                    "rate_limits": record.rate_limits,
+                    "success_rate": round(record.success_rate, 3),
+                    "avg_latency_s": None if record.latency is None else round(record.latency, 3),
+                    "circuit": next((state for state in ("open", "half_open") if state in states), "closed"),
+                    "reopens_in_s": max(0, int(open_until - now)),
+                    "last_error": record.last_error,
+                })
+            return rows
+
+    def reset(self, vendor: Optional[str] = None) -> None:
+        with self._lock:
+            if vendor is None:
+                self._records.clear()
+                self._vendor_open_until.clear()
+                self._trials.clear()
+            else:
+                self._vendor_open_until.pop(vendor, None)
+                for key in [k for k in self._trials if k[0] == vendor]:
+                    del self._trials[key]
+                for key in [k for k in self._records if k[0] == vendor]:
+                    del self._records[key]
+
+
+_tracker = VendorHealthTracker()
+
+
+def get_vendor_health() -> VendorHealthTracker:
+    """Return the process-wide vendor health tracker."""
+    return _tracker
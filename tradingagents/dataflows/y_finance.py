@@ -1,9 +1,89 @@
 from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import yfinance as yf
+import pandas as pd
 import os
 from .stockstats_utils import StockstatsUtils
+from .price_store import load_price_history, covers_start_date
+from .utils import parse_indicator_list
+from .indicator_cache import get_indicator_cache
+from .local_price_loader import find_price_file, load_price_csv
+from .yfin_pool import get_ticker, get_statement
+from .output_format import is_compact_output, compact_price_frame, float_format, format_value, report_savings
+
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -14,11 +94,15 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = ticker.history(start=start_date, end=end_date)
+    if covers_start_date(start_date):
+        # Serve from the shared incremental price store
+        data = load_price_history(symbol, start_date, end_date)
+        if not data.empty:
+            data = data.set_index("Date")
+    else:
+        # Requested range predates the store, fetch it directly
+        ticker = get_ticker(symbol)
+        data = ticker.history(start=start_date, end=end_date)
 
     # Check if data is empty
     if data.empty:
@@ -30,6 +114,13 @@ def get_YFin_data_online(
     if data.index.tz is not None:
         data.index = data.index.tz_localize(None)
 
+    compact = None
+    if is_compact_output():
+        compact = (
+            f"# {symbol.upper()} daily bars {start_date} to {end_date}, {len(data)} rows\n"
+            + compact_price_frame(data).to_csv(float_format=float_format())
+        )
+
     # Round numerical values to 2 decimal places for cleaner display
     numeric_columns = ["Open", "High", "Low", "Close", "Adj Close"]
     for col in numeric_columns:
@@ -44,124 +135,71 @@ def get_YFin_data_online(
     header += f"# Total records: {len(data)}\n"
     header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
 
+    if compact is not None:
+        report_savings("get_YFin_data_online", header + csv_string, compact)
+        return compact
+
     return header + csv_string
 
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to get the analysis and report of"],
+    indicator: Annotated[
+        str | list[str],
+        "technical indicator(s) to get the analysis and report of; a list or comma-separated names",
+    ],
     curr_date: Annotated[
         str, "The current trading date you are trading on, YYYY-mm-dd"
     ],
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
-        raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+    indicators = parse_indicator_list(indicator)
+    for name in indicators:
+        if name not in BEST_IND_PARAMS:
+            raise ValueError(
+                f"Indicator {name} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+            )
+
+    if len(indicators) > 1:
+        return _get_stock_stats_indicators_table(
+            symbol, indicators, curr_date, look_back_days
         )
+    indicator = indicators[0]
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
     # Optimized: Get stock data once and calculate indicators for all dates
+    compact = None
     try:
         indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+
+        # Only the look-back window is ever turned into Python strings
+        window = indicator_data.loc[before:curr_date_dt]
+        window = window.map(lambda value: "N/A" if pd.isna(value) else str(value))
+
+        # Walk the calendar backwards from curr_date, flagging days without a bar
+        calendar = pd.date_range(start=before, end=curr_date_dt, freq="D")[::-1]
+        window = window.reindex(
+            calendar, fill_value="N/A: Not a trading day (weekend or holiday)"
+        )
+
+        lines = window.index.strftime("%Y-%m-%d") + ": " + window.values
+        ind_string = "\n".join(lines) + "\n"
+
+        if is_compact_output():
+            # Trading days only, fixed significant digits; the descriptions are
+            # already in the market analyst's system prompt
+            trading_days = indicator_data.loc[before:curr_date_dt].iloc[::-1]
+            compact = (
+                f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date} (trading days only):\n\n"
+                + "".join(
+                    f"{day.strftime('%Y-%m-%d')}: {format_value(value)}\n"
+                    for day, value in trading_days.items()
+                )
+            )
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
@@ -178,93 +216,132 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
     )
 
+    if compact is not None:
+        report_savings("get_stock_stats_indicators_window", result_str, compact)
+        return compact
+
     return result_str
 
 
-def _get_stock_stats_bulk(
+def _get_stock_stats_indicators_table(
     symbol: Annotated[str, "ticker symbol of the company"],
-    indicator: Annotated[str, "technical indicator to calculate"],
-    curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+    indicators: Annotated[list[str], "technical indicators to report side by side"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
     """
-    Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Report several indicators over the same window as one table.
+    All indicators are computed on a single load of the price history.
+    Rows are trading days only, newest first.
+    """
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    try:
+        indicator_data = _get_stock_stats_frame(symbol, indicators, curr_date)
+        window = indicator_data.loc[before:curr_date_dt].iloc[::-1]
+        window.index = window.index.strftime("%Y-%m-%d")
+        window.index.name = "Date"
+        table = window.to_csv(na_rep="N/A")
+    except Exception as e:
+        print(f"Error getting bulk stockstats data: {e}")
+        # Fall back to one window per indicator
+        return "\n\n".join(
+            get_stock_stats_indicators_window(symbol, name, curr_date, look_back_days)
+            for name in indicators
+        )
+
+    descriptions = "\n".join(
+        f"- {name}: {BEST_IND_PARAMS[name]}" for name in indicators
+    )
+
+    title = f"## {', '.join(indicators)} values from {before.strftime('%Y-%m-%d')} to {curr_date} (trading days only):\n\n"
+    result_str = title + table + "\n\n" + descriptions
+
+    if is_compact_output():
+        # The descriptions are already in the market analyst's system prompt
+        compact = title + window.to_csv(na_rep="N/A", float_format=float_format())
+        report_savings("get_stock_stats_indicators_window", result_str, compact)
+        return compact
+
+    return result_str
+
+
+def _get_stock_stats_frame(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list[str], "technical indicators to calculate"],
+    curr_date: Annotated[str, "date the local price file must reach, YYYY-mm-dd"] = None,
+) -> pd.DataFrame:
+    """
+    Load the price history once and calculate every requested indicator on it.
+    Returns a DataFrame with one column per indicator, indexed by a sorted DatetimeIndex.
     """
     from .config import get_config
-    import pandas as pd
     from stockstats import wrap
-    import os
-    
+
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
         try:
-            data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
-            )
-            df = wrap(data)
+            _, _, data_path = find_price_file(config.get("data_cache_dir", "data"), symbol, end_date=curr_date)
+            data = load_price_csv(data_path).copy()
+            data["Date"] = pd.to_datetime(data["Date"].astype(str).str[:10])
         except FileNotFoundError:
             raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
     else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
+        # Online data comes from the shared incremental price store
+        data = load_price_history(symbol)
+        if data.empty:
+            raise Exception(f"Stockstats fail: no price data returned for {symbol}")
+
+    if data["Date"].duplicated().any() or not data["Date"].is_monotonic_increasing:
+        data = data.drop_duplicates("Date", keep="last").sort_values("Date")
+        data = data.reset_index(drop=True)
+
+    dates = pd.DatetimeIndex(data["Date"])
+    source = "yfinance" if online else "local"
+    cache = get_indicator_cache()
+
+    # Reuse series computed on the same price history, keyed on its last bar and contents
+    fingerprint = cache.fingerprint(data)
+    columns = {}
+    missing = []
+    for name in indicators:
+        cached = cache.get(cache.make_key(source, symbol, name, dates[-1], fingerprint))
+        if cached is None:
+            missing.append(name)
         else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
+            columns[name] = cached
+
+    if missing:
+        # Calculate the remaining indicators on the same wrapped frame
         df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+        for name in missing:
+            series = pd.Series(df[name].values, index=dates)
+            cache.put(cache.make_key(source, symbol, name, dates[-1], fingerprint), series)
+            columns[name] = series
+
+    return pd.DataFrame({name: columns[name] for name in indicators})
+
+
+def _get_stock_stats_bulk(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicator: Annotated[str, "technical indicator to calculate"],
+    curr_date: Annotated[str, "current date for reference"]
+) -> pd.Series:
+    """
+    Optimized bulk calculation of stock stats indicators.
+    Fetches data once and calculates indicator for all available dates.
+    Returns a Series of raw indicator values indexed by a sorted DatetimeIndex.
+    """
+    return _get_stock_stats_frame(symbol, [indicator], curr_date)[indicator]
 
 
 def get_stockstats_indicator(
@@ -300,12 +377,11 @@ def get_balance_sheet(
 ):
     """Get balance sheet data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        # Served from the ticker's fundamentals bundle, fetched once per trading day
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
+            data = get_statement(ticker, "quarterly_balance_sheet")
         else:
-            data = ticker_obj.balance_sheet
+            data = get_statement(ticker, "balance_sheet")
             
         if data.empty:
             return f"No balance sheet data found for symbol '{ticker}'"
@@ -330,12 +406,11 @@ def get_cashflow(
 ):
     """Get cash flow data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        # Served from the ticker's fundamentals bundle, fetched once per trading day
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
+            data = get_statement(ticker, "quarterly_cashflow")
         else:
-            data = ticker_obj.cashflow
+            data = get_statement(ticker, "cashflow")
             
         if data.empty:
             return f"No cash flow data found for symbol '{ticker}'"
@@ -360,12 +435,11 @@ def get_income_statement(
 ):
     """Get income statement data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        # Served from the ticker's fundamentals bundle, fetched once per trading day
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
+            data = get_statement(ticker, "quarterly_income_stmt")
         else:
-            data = ticker_obj.income_stmt
+            data = get_statement(ticker, "income_stmt")
             
         if data.empty:
             return f"No income statement data found for symbol '{ticker}'"
@@ -388,8 +462,8 @@ def get_insider_transactions(
 ):
     """Get insider transactions data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
+        # Served from the ticker's fundamentals bundle, fetched once per trading day
+        data = get_statement(ticker, "insider_transactions")
         
         if data is None or data.empty:
             return f"No insider transactions data found for symbol '{ticker}'"
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Annotated, Dict
+
+import pandas as pd
+import yfinance as yf
+
+from .keyed_locks import KeyedLocks
+
+# Ticker attributes fetched together for the fundamentals analyst
+BUNDLE_STATEMENTS = (
+    "balance_sheet",
+    "quarterly_balance_sheet",
+    "cashflow",
+    "quarterly_cashflow",
+    "income_stmt",
+    "quarterly_income_stmt",
+    "insider_transactions",
+)
+
+MAX_POOLED_TICKERS = 256
+
+_tickers: "OrderedDict[str, yf.Ticker]" = OrderedDict()
+_tickers_guard = threading.Lock()
+
+# symbol -> (trading day, statement name -> DataFrame), least recently used first
+_bundles: "OrderedDict[str, tuple]" = OrderedDict()
+_bundles_guard = threading.Lock()
+_bundle_locks = KeyedLocks()
+
+
+def get_ticker(symbol: Annotated[str, "ticker symbol of the company"]) -> yf.Ticker:
+    """Return the process-wide yf.Ticker for symbol, so its session and lazily loaded data are reused."""
+    symbol = symbol.upper()
+    with _tickers_guard:
+        ticker = _tickers.get(symbol)
+        if ticker is None:
+            ticker = _tickers[symbol] = yf.Ticker(symbol)
+            while len(_tickers) > MAX_POOLED_TICKERS:
+                _tickers.popitem(last=False)
+        _tickers.move_to_end(symbol)
+        return ticker
+
+
+def _store_bundle(symbol: str, trading_day: str, statements: Dict[str, pd.DataFrame]) -> None:
+    with _bundles_guard:
+        _bundles[symbol] = (trading_day, statements)
+        _bundles.move_to_end(symbol)
+        while len(_bundles) > MAX_POOLED_TICKERS:
+            _bundles.popitem(last=False)
+
+
+def get_statement(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    name: Annotated[str, "one of BUNDLE_STATEMENTS"],
+) -> pd.DataFrame:
+    """
+    Return one statement from the symbol's fundamentals bundle.
+
+    The first request of the trading day fetches every statement in
+    BUNDLE_STATEMENTS (annual and quarterly) for the symbol in one pass; the
+    rest are then served from memory until the date changes. Concurrent
+    callers for the same symbol wait for that single fetch. A statement that
+    failed to load is retried alone the next time it is requested, and the
+    failure is raised to the caller that asked for it.
+    """
+    symbol = symbol.upper()
+    trading_day = datetime.now().strftime("%Y-%m-%d")
+
+    with _bundle_locks.hold(symbol):
+        with _bundles_guard:
+            day, statements = _bundles.get(symbol, (None, {}))
+        if day != trading_day:
+            statements, to_fetch = {}, BUNDLE_STATEMENTS
+        elif name in BUNDLE_STATEMENTS and name not in statements:
+            to_fetch = (name,)
+        else:
+            to_fetch = ()
+
+        fetched, errors = {}, {}
+        if to_fetch:
+            statements = dict(statements)
+            # A fresh Ticker, not the pooled one: yfinance memoizes statements
+            # (empty ones included, on fetch errors) for the Ticker's lifetime
+            ticker = yf.Ticker(symbol)
+            for statement in to_fetch:
+                try:
+                    fetched[statement] = getattr(ticker, statement)
+                except Exception as e:
+                    errors[statement] = e
+                    continue
+                if fetched[statement] is not None and not getattr(fetched[statement], "empty", False):
+                    statements[statement] = fetched[statement]
+            _store_bundle(symbol, trading_day, statements)
+
+    if name in statements:
+        return statements[name]
+    if name in fetched:
+        # Empty this time; returned as is and refetched on the next request
+        return fetched[name]
+    if name in errors:
+        raise errors[name]
+    # Not part of the bundle
+    return getattr(get_ticker(symbol), name)
@@ -15,6 +15,27 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # On-disk cache of vendor responses, see dataflows/vendor_cache.py
+    "vendor_cache_enabled": True,
+    # Seconds a cached response stays valid, per data category.
+    # Price/indicator queries that end before today are cached forever.
+    "vendor_cache_ttls": {
+        "core_stock_apis": 60 * 60,
+        "technical_indicators": 60 * 60,
+        "fundamental_data": 3 * 24 * 60 * 60,
+        "news_data": 6 * 60 * 60,
+    },
+    # Byte budget for the in-process cache of computed indicator series
+    "indicator_cache_max_bytes": 64 * 1024 * 1024,
+    # Number of local YFin price CSVs kept parsed in memory
+    "local_price_cache_size": 32,
+    # Index company mentions per post when building the Reddit date index
+    "reddit_mention_index": True,
+    # Google News scraping: politeness budget per host and parsed-result cache
+    "google_news_min_interval": 1.5,  # seconds between request starts
+    "google_news_jitter": 1.5,  # extra random seconds between request starts
+    "google_news_pipeline_depth": 2,  # pages fetched ahead / in flight per host
+    "google_news_cache_ttl": 6 * 60 * 60,  # seconds, for windows that include today
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",
@@ -37,4 +58,42 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Concurrent vendor execution in route_to_vendor
+    "vendor_concurrency_enabled": True,
+    "vendor_max_workers": 16,
+    "vendor_call_timeout": 300,  # seconds per vendor call, None to wait forever
+    "vendor_hedge_after": None,  # seconds before starting the first fallback, None disables hedging
+    "vendor_single_flight_enabled": True,  # concurrent identical calls share one vendor execution
+    # Rendering of price and indicator tool results: "full" or "compact" (trading days
+    # only, fixed significant digits, no redundant columns or repeated descriptions)
+    "tool_output_format": "full",
+    "compact_significant_digits": 5,
+    "compact_savings_log": False,  # print a COMPACT: line per call; totals are always kept (get_output_savings)
+    # Shared async HTTP client used by aroute_to_vendor (one per event loop)
+    "async_max_connections": 32,
+    "async_max_keepalive": 16,
+    "async_http_timeout": 30,  # seconds
+    # Vendor health tracking: skip vendors that keep failing or are rate limited
+    "vendor_circuit_breaker_enabled": True,
+    "vendor_failure_threshold": 3,  # consecutive failures before a vendor is skipped
+    "vendor_failure_cooldown": 5 * 60,  # seconds
+    "vendor_rate_limit_cooldown": 60 * 60,  # seconds
+    # Prefetch predictable tool data at the start of propagate()
+    "prefetch_enabled": True,
+    "prefetch_max_workers": 8,
+    "prefetch_price_look_back_days": 90,
+    "prefetch_skip_vendors": ["alpha_vantage", "openai"],  # quota/token-billed, not spent speculatively
+    # Persistent embedding cache for the agents' memories, keyed by (model, text hash)
+    "embedding_cache_enabled": True,
+    "embedding_cache_max_entries": 50_000,  # least recently used entries are evicted past this
+    # Batched embedding requests when adding memories (e.g. loading an Obsidian vault)
+    "embedding_batch_size": 256,  # texts per embeddings request
+    "embedding_batch_max_tokens": 250_000,  # estimated tokens per request, under the API limit
+    "embedding_max_concurrency": 4,  # batches in flight at once
+    "memory_add_batch_size": 1000,  # records per Chroma add call
+    # Alpha Vantage client-side throttling (per API key), None disables a limit
+    "alpha_vantage_calls_per_minute": 5,
+    "alpha_vantage_calls_per_day": 25,
+    "alpha_vantage_timeout": 30,  # seconds per HTTP request
+    "alpha_vantage_max_wait": 120,  # longest a call queues for a slot before failing over
 }
@@ -0,0 +1,147 @@
+# TradingAgents/graph/prefetch.py
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+from tradingagents.dataflows.interface import (
+    route_to_vendor,
+    VENDOR_METHODS,
+    get_category_for_method,
+    get_vendor,
+)
+
+# Indicators the market analyst is offered; warming all of them fills the indicator cache
+STANDARD_INDICATORS = [
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+]
+
+
+class PrefetchRun:
+    """Prefetch calls in flight for one propagate() run."""
+
+    def __init__(self, calls: List[Tuple[str, tuple]], max_workers: int, skip_vendors=()):
+        self.calls = calls
+        self.skip_vendors = tuple(skip_vendors)
+        self.started_at = time.monotonic()
+        self.finished_at = None
+        self.durations: Dict[Tuple[str, tuple], float] = {}
+        self.failures: Dict[Tuple[str, tuple], str] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(calls))), thread_name_prefix="prefetch"
+        )
+        self._futures = [self._executor.submit(self._fetch, method, args) for method, args in calls]
+        self._executor.shutdown(wait=False)
+
+    def _fetch(self, method: str, args: tuple) -> None:
+        started = time.monotonic()
+        try:
+            # Skipped vendors are left out of the fallback chain too, not just as primaries
+            route_to_vendor(method, *args, skip_vendors=self.skip_vendors)
+        except Exception as e:
+            with self._lock:
+                self.failures[(method, args)] = str(e)
+            return
+        finally:
+            with self._lock:
+                self.durations[(method, args)] = time.monotonic() - started
+                if len(self.durations) == len(self.calls):
+                    self.finished_at = time.monotonic()
+
+    def report(self, run_finished_at: float) -> Dict[str, Any]:
+        """Summarize the prefetch once the graph run is over.
+
+        Vendor time hidden is the fetch time of the calls that completed
+        successfully before the run ended; the agents' tool calls for the same
+        data were served from the caches instead of paying it again.
+        """
+        with self._lock:
+            warmed = {
+                key: duration for key, duration in self.durations.items()
+                if key not in self.failures
+            }
+            finished_at = self.finished_at
+        report = {
+            "calls": len(self.calls),
+            "warmed": len(warmed),
+            "failed": len(self.failures),
+            "pending": len(self.calls) - len(self.durations),
+            "vendor_seconds_hidden": round(sum(warmed.values()), 2),
+            "wall_seconds": round((finished_at or run_finished_at) - self.started_at, 2),
+        }
+        print(
+            f"PREFETCH: warmed {report['warmed']}/{report['calls']} calls in {report['wall_seconds']}s, "
+            f"hiding {report['vendor_seconds_hidden']}s of vendor latency behind the LLM run"
+            + (f" ({report['failed']} failed)" if report["failed"] else "")
+        )
+        return report
+
+
+class DataPrefetcher:
+    """Warms the data caches with the calls the selected analysts predictably make."""
+
+    def __init__(self, config: Dict[str, Any], selected_analysts: List[str]):
+        self.config = config
+        self.selected_analysts = list(selected_analysts)
+
+    def plan(self, ticker: str, trade_date: str) -> List[Tuple[str, tuple]]:
+        """(method, args) for every tool call worth prefetching, in route_to_vendor form."""
+        trade_date = str(trade_date)
+        curr = datetime.strptime(trade_date, "%Y-%m-%d")
+        week_ago = (curr - relativedelta(days=7)).strftime("%Y-%m-%d")
+        price_start = (curr - relativedelta(days=self.config.get("prefetch_price_look_back_days", 90))).strftime("%Y-%m-%d")
+
+        calls = []
+        if "market" in self.selected_analysts:
+            calls.append(("get_stock_data", (ticker, price_start, trade_date)))
+            calls.append(("get_indicators", (ticker, ",".join(STANDARD_INDICATORS), trade_date, 30)))
+        if "social" in self.selected_analysts or "news" in self.selected_analysts:
+            calls.append(("get_news", (ticker, week_ago, trade_date)))
+        if "news" in self.selected_analysts:
+            calls.append(("get_global_news", (trade_date, 7, 5)))
+        if "fundamentals" in self.selected_analysts:
+            calls.append(("get_fundamentals", (ticker, trade_date)))
+            for method in ("get_balance_sheet", "get_cashflow", "get_income_statement"):
+                calls.append((method, (ticker, "quarterly", trade_date)))
+
+        # Quota- or token-billed vendors are not spent on speculative calls, and
+        # warming another vendor than the one the agents will use saves nothing
+        skip_vendors = set(self.config.get("prefetch_skip_vendors", []))
+        return [
+            (method, args) for method, args in calls
+            if not self._first_vendors(method) & skip_vendors
+        ]
+
+    @staticmethod
+    def _first_vendors(method: str) -> set:
+        """Vendors a tool call for method tries first: its supported primaries, else the first fallback."""
+        vendor_config = get_vendor(get_category_for_method(method), method)
+        supported = VENDOR_METHODS[method]
+        primaries = {v.strip() for v in vendor_config.split(",")} & set(supported)
+        return primaries or {next(iter(supported))}
+
+    def start(self, ticker: str, trade_date: str) -> PrefetchRun:
+        """Start prefetching in the background and return immediately."""
+        calls = self.plan(ticker, trade_date)
+        print(f"PREFETCH: warming {len(calls)} data calls for {ticker} on {trade_date}")
+        return PrefetchRun(
+            calls,
+            self.config.get("prefetch_max_workers", 8),
+            self.config.get("prefetch_skip_vendors", []),
+        )
@@ -1,6 +1,7 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import time
 from pathlib import Path
 import json
 from datetime import date
@@ -14,7 +15,7 @@ from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory import FinancialSituationMemory, SituationMemoryContext
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -41,6 +42,7 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .prefetch import DataPrefetcher
 
 
 class TradingAgentsGraph:
@@ -64,6 +66,9 @@ class TradingAgentsGraph:
 
         # Update the interface's config
         set_config(self.config)
+        if self.debug:
+            # Debug runs also log each call's compact-output savings
+            set_config({"compact_savings_log": True})
 
         # Create necessary directories
         os.makedirs(
@@ -114,11 +119,13 @@ class TradingAgentsGraph:
         self.propagator = Propagator()
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
+        self.prefetcher = DataPrefetcher(self.config, selected_analysts)
 
         # State tracking
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        self.last_prefetch_report = None
 
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
@@ -165,6 +172,22 @@ class TradingAgentsGraph:
 
         self.ticker = company_name
 
+        # Warm the data caches while the first LLM turns run
+        prefetch = None
+        if self.config.get("prefetch_enabled", True):
+            prefetch = self.prefetcher.start(company_name, trade_date)
+
+        # Embed the analysts' situation once and reuse it for every memory and debate round
+        SituationMemoryContext(
+            [
+                self.bull_memory,
+                self.bear_memory,
+                self.trader_memory,
+                self.invest_judge_memory,
+                self.risk_manager_memory,
+            ]
+        ).attach()
+
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
@@ -186,6 +209,9 @@ class TradingAgentsGraph:
             # Standard mode without tracing
             final_state = self.graph.invoke(init_agent_state, **args)
 
+        if prefetch is not None:
+            self.last_prefetch_report = prefetch.report(time.monotonic())
+
         # Store current state for reflection
         self.curr_state = final_state
 